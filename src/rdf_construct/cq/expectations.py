@@ -75,13 +75,41 @@ class BooleanExpectation(Expectation):
         return f"ASK = {self.expected}"
 
 
+# Sentinel for an exhausted result iterator
+_NO_ROW = object()
+
+
+def _known_count(result: Result) -> int | None:
+    """Return the number of rows in a result if it is already materialised.
+
+    A lazy rdflib Result would have to run to completion to be counted, so
+    None is returned for it (and for anything without a length).
+    """
+    if isinstance(result, Result) or not hasattr(result, "__len__"):
+        return None
+    return len(result)
+
+
+def _has_rows(result: Result) -> bool:
+    """Return True if a result yields at least one row, reading at most one."""
+    return next(iter(result), _NO_ROW) is not _NO_ROW
+
+
 class HasResultsExpectation(Expectation):
     """Expectation that a query returns at least one result."""
 
     def check(self, result: Result) -> CheckResult:
-        # Convert to list to count (consumes the iterator)
-        results_list = list(result)
-        count = len(results_list)
+        count = _known_count(result)
+        if count is None:
+            # Only existence matters, so stop at the first row
+            passed = _has_rows(result)
+            return CheckResult(
+                passed=passed,
+                message="Found result(s)" if passed else "No results found",
+                expected="≥1 results",
+                actual="≥1 results" if passed else "0 results",
+            )
+
         passed = count > 0
 
         return CheckResult(
@@ -99,8 +127,17 @@ class NoResultsExpectation(Expectation):
     """Expectation that a query returns zero results."""
 
     def check(self, result: Result) -> CheckResult:
-        results_list = list(result)
-        count = len(results_list)
+        count = _known_count(result)
+        if count is None:
+            # Only existence matters, so stop at the first row
+            passed = not _has_rows(result)
+            return CheckResult(
+                passed=passed,
+                message="No results (as expected)" if passed else "Expected no results, got ≥1",
+                expected="0 results",
+                actual="0 results" if passed else "≥1 results",
+            )
+
         passed = count == 0
 
         return CheckResult(
@@ -244,15 +281,22 @@ class ContainsExpectation(Expectation):
         results_list = list(result)
         actual_bindings = [self._normalize_row(row) for row in results_list]
 
+        # Rows projected onto each set of expected variables, so each lookup
+        # is a set membership test rather than a scan of every row
+        projections: dict[tuple[str, ...], set[tuple[str, ...]]] = {}
+
         missing = []
         for expected in self.expected_bindings:
             normalized_expected = self._normalize_dict(expected)
-            found = False
-            for actual in actual_bindings:
-                if self._matches(actual, normalized_expected):
-                    found = True
-                    break
-            if not found:
+            keys = tuple(sorted(normalized_expected))
+            rows = projections.get(keys)
+            if rows is None:
+                rows = projections[keys] = {
+                    tuple(actual[key] for key in keys)
+                    for actual in actual_bindings
+                    if all(key in actual for key in keys)
+                }
+            if tuple(normalized_expected[key] for key in keys) not in rows:
                 missing.append(normalized_expected)
 
         passed = len(missing) == 0
@@ -269,13 +313,6 @@ class ContainsExpectation(Expectation):
             actual=f"Missing: {missing}" if missing else "All present",
         )
 
-    def _matches(self, actual: dict[str, str], expected: dict[str, str]) -> bool:
-        """Check if actual contains all expected key-value pairs."""
-        for key, value in expected.items():
-            if key not in actual or actual[key] != value:
-                return False
-        return True
-
     def _normalize_row(self, row) -> dict[str, str]:
         """Normalize a result row for comparison."""
         # rdflib ResultRow has asdict() method
@@ -4,6 +4,8 @@ Parses YAML files containing competency questions with SPARQL queries
 and their expected results.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,9 @@ from rdflib import Graph
 
 from rdf_construct.cq.expectations import Expectation, parse_expectation
 
+# A SPARQL prefix declaration, capturing the prefix name and namespace IRI
+_PREFIX_DECL = re.compile(r"\bPREFIX\s+([^\s:]*):\s*<([^>]*)>", re.IGNORECASE)
+
 
 @dataclass
 class CQTest:
@@ -27,6 +32,7 @@ class CQTest:
         expectation: What result is expected
         skip: Whether to skip this test
         skip_reason: Reason for skipping (if skip is True)
+        tag_set: Tags as a frozenset, for filtering
     """
     id: str
     name: str
@@ -36,6 +42,13 @@ class CQTest:
     tags: list[str] = field(default_factory=list)
     skip: bool = False
     skip_reason: str | None = None
+    tag_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Build the tag set; tags stays a list since reports keep its order."""
+        self.tag_set = frozenset(self.tags)
+        # Questions sharing a query text (e.g. from templates) share one string
+        self.query = sys.intern(self.query)
 
 
 @dataclass
@@ -49,6 +62,7 @@ class CQTestSuite:
         version: Optional format version string
         name: Optional suite name
         description: Optional suite description
+        expanded_queries: Prefix-expanded query for each distinct query text
     """
     prefixes: dict[str, str]
     questions: list[CQTest]
@@ -56,6 +70,28 @@ class CQTestSuite:
     version: str | None = None
     name: str | None = None
     description: str | None = None
+    expanded_queries: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Expand every question's query once, so runs skip prefix injection."""
+        self.expanded_queries = {}
+        for q in self.questions:
+            self.expanded_query(q)
+
+    def expanded_query(self, test: CQTest) -> str:
+        """Return a test's query with the suite prefixes injected.
+
+        Args:
+            test: Test whose query to expand
+
+        Returns:
+            Query with prefix declarations prepended
+        """
+        expanded = self.expanded_queries.get(test.query)
+        if expanded is None:
+            expanded = build_query_with_prefixes(test.query, self.prefixes)
+            self.expanded_queries[test.query] = expanded
+        return expanded
 
     def filter_by_tags(self, include_tags: set[str] | None = None,
                        exclude_tags: set[str] | None = None) -> "CQTestSuite":
@@ -70,14 +106,12 @@ class CQTestSuite:
         """
         filtered = []
         for q in self.questions:
-            question_tags = set(q.tags)
-
             # Check exclusions first
-            if exclude_tags and question_tags & exclude_tags:
+            if exclude_tags and not q.tag_set.isdisjoint(exclude_tags):
                 continue
 
             # Check inclusions
-            if include_tags and not (question_tags & include_tags):
+            if include_tags and q.tag_set.isdisjoint(include_tags):
                 continue
 
             filtered.append(q)
@@ -249,6 +283,8 @@ def _parse_question(q: dict[str, Any], prefixes: dict[str, str]) -> CQTest:
         raise ValueError(f"Question '{q['id']}' missing required 'query' field")
     if "expect" not in q:
         raise ValueError(f"Question '{q['id']}' missing required 'expect' field")
+    if not isinstance(q["query"], str):
+        raise ValueError(f"Question '{q['id']}' 'query' field must be a string")
 
     # Parse expectation
     expectation = parse_expectation(q["expect"])
@@ -284,16 +320,17 @@ def build_query_with_prefixes(query: str, prefixes: dict[str, str]) -> str:
     Returns:
         Query with prefix declarations prepended
     """
-    # Check if query already has PREFIX declarations
-    query_upper = query.upper().strip()
+    # Find the declarations already in the query in one pass
+    declared = {
+        (prefix.upper(), uri.upper()) for prefix, uri in _PREFIX_DECL.findall(query)
+    }
 
-    # Build prefix declarations
-    prefix_lines = []
-    for prefix, uri in prefixes.items():
-        prefix_decl = f"PREFIX {prefix}: <{uri}>"
-        # Only add if not already declared
-        if prefix_decl.upper() not in query_upper:
-            prefix_lines.append(prefix_decl)
+    # Build prefix declarations, skipping any already declared
+    prefix_lines = [
+        f"PREFIX {prefix}: <{uri}>"
+        for prefix, uri in prefixes.items()
+        if (prefix.upper(), uri.upper()) not in declared
+    ]
 
     if prefix_lines:
         return "\n".join(prefix_lines) + "\n\n" + query
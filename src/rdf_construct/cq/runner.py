@@ -4,16 +4,64 @@ Runs SPARQL queries against RDF graphs and checks results against expectations.
 """
 
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
+from rdflib.store import Store
 
 from rdf_construct.cq.loader import CQTest, CQTestSuite, build_query_with_prefixes
 from rdf_construct.cq.expectations import CheckResult
 
 
+@lru_cache(maxsize=512)
+def _prepare_query(query: str, namespaces: tuple[tuple[str, str], ...]) -> Query:
+    """Parse and translate a SPARQL query, cached by text and namespaces.
+
+    Prepared queries hold no graph state, so one can be evaluated against
+    any graph. Namespaces are part of the key because prefixes that the
+    query doesn't declare are resolved from them at translation time.
+
+    Only used for stores that leave SPARQL to rdflib's evaluator; stores
+    with their own engine (see _store_evaluates_sparql) reject prepared
+    queries, so they are sent the query text instead.
+
+    Args:
+        query: SPARQL query string
+        namespaces: (prefix, namespace) pairs bound on the queried graph
+
+    Returns:
+        Prepared query object
+    """
+    return prepareQuery(query, initNs=dict(namespaces))
+
+
+# query() implementations that only defer to rdflib's own evaluator: the base
+# Store's, and the in-memory stores' overrides that call it
+_PYTHON_QUERY_METHODS = (Store.query, Memory.query, SimpleMemory.query)
+
+
+def _store_evaluates_sparql(store: Store) -> bool:
+    """Return True if a store runs SPARQL with its own engine.
+
+    Such stores (e.g. SPARQLStore or Oxigraph) accept only query strings and
+    raise NotImplementedError for prepared queries.
+
+    Args:
+        store: Store behind the queried graph
+
+    Returns:
+        True if the store evaluates query strings natively
+    """
+    return type(store).query not in _PYTHON_QUERY_METHODS
+
+
 class CQStatus(Enum):
     """Status of a test execution."""
     PASS = "pass"
@@ -78,25 +126,33 @@ class CQTestResults:
         """Total number of tests."""
         return len(self.results)
 
+    @cached_property
+    def status_counts(self) -> Counter[CQStatus]:
+        """Number of tests with each status, counted on first access.
+
+        The counts are not refreshed if results is changed afterwards.
+        """
+        return Counter(r.status for r in self.results)
+
     @property
     def passed_count(self) -> int:
         """Number of passed tests."""
-        return sum(1 for r in self.results if r.status == CQStatus.PASS)
+        return self.status_counts[CQStatus.PASS]
 
     @property
     def failed_count(self) -> int:
         """Number of failed tests."""
-        return sum(1 for r in self.results if r.status == CQStatus.FAIL)
+        return self.status_counts[CQStatus.FAIL]
 
     @property
     def error_count(self) -> int:
         """Number of tests with errors."""
-        return sum(1 for r in self.results if r.status == CQStatus.ERROR)
+        return self.status_counts[CQStatus.ERROR]
 
     @property
     def skipped_count(self) -> int:
         """Number of skipped tests."""
-        return sum(1 for r in self.results if r.status == CQStatus.SKIP)
+        return self.status_counts[CQStatus.SKIP]
 
     @property
     def all_passed(self) -> bool:
@@ -144,6 +200,11 @@ class CQTestRunner:
 
         Returns:
             CQTestResults with all test results
+
+        Note:
+            Queries against stores that leave SPARQL to rdflib are parsed
+            once and reused across questions. Stores with a native SPARQL
+            engine are sent the query text, which they parse themselves.
         """
         start_time = time.perf_counter()
 
@@ -156,14 +217,12 @@ class CQTestRunner:
         # Bind prefixes for query execution
         for prefix, uri in suite.prefixes.items():
             graph.bind(prefix, uri)
+        # Graph bindings, as graph.query() would use them to resolve prefixes
+        namespaces = tuple(sorted(graph.namespaces()))
 
-        results = []
-        for test in suite.questions:
-            result = self._run_test(graph, test, suite.prefixes)
-            results.append(result)
-
-            if self.fail_fast and result.status in (CQStatus.FAIL, CQStatus.ERROR):
-                break
+        # Pick the loop once rather than checking fail_fast per question
+        run_questions = self._run_until_failure if self.fail_fast else self._run_all
+        results = run_questions(graph, suite, namespaces)
 
         total_duration = (time.perf_counter() - start_time) * 1000
 
@@ -174,14 +233,60 @@ class CQTestRunner:
             ontology_file=ontology_file,
         )
 
+    def _run_all(self, graph: Graph, suite: CQTestSuite,
+                 namespaces: tuple[tuple[str, str], ...]) -> list[CQTestResult]:
+        """Run every test in a suite.
+
+        Args:
+            graph: Combined ontology + data graph
+            suite: Test suite to execute
+            namespaces: Sorted namespace bindings of the graph
+
+        Returns:
+            Results for all tests, in suite order
+        """
+        prefixes = suite.prefixes
+        return [
+            self._run_test(graph, test, prefixes, namespaces, suite.expanded_query(test))
+            for test in suite.questions
+        ]
+
+    def _run_until_failure(self, graph: Graph, suite: CQTestSuite,
+                           namespaces: tuple[tuple[str, str], ...]) -> list[CQTestResult]:
+        """Run tests in a suite, stopping after the first failure or error.
+
+        Args:
+            graph: Combined ontology + data graph
+            suite: Test suite to execute
+            namespaces: Sorted namespace bindings of the graph
+
+        Returns:
+            Results for the tests run, in suite order
+        """
+        results = []
+        for test in suite.questions:
+            result = self._run_test(
+                graph, test, suite.prefixes, namespaces, suite.expanded_query(test)
+            )
+            results.append(result)
+            if result.status in (CQStatus.FAIL, CQStatus.ERROR):
+                break
+        return results
+
     def _run_test(self, graph: Graph, test: CQTest,
-                  prefixes: dict[str, str]) -> CQTestResult:
+                  prefixes: dict[str, str],
+                  namespaces: tuple[tuple[str, str], ...] | None = None,
+                  full_query: str | None = None) -> CQTestResult:
         """Run a single test.
 
         Args:
             graph: Combined ontology + data graph
             test: Test to run
             prefixes: Prefix definitions for query injection
+            namespaces: Sorted namespace bindings of the graph (read from
+                the graph if not given)
+            full_query: Query with prefixes already injected (built from
+                the test query and prefixes if not given)
 
         Returns:
             CQTestResult with status and details
@@ -195,12 +300,20 @@ class CQTestRunner:
 
         start_time = time.perf_counter()
 
+        if namespaces is None:
+            namespaces = tuple(sorted(graph.namespaces()))
+
         try:
             # Inject prefixes into query
-            full_query = build_query_with_prefixes(test.query, prefixes)
+            if full_query is None:
+                full_query = build_query_with_prefixes(test.query, prefixes)
 
-            # Execute query
-            result = graph.query(full_query)
+            if _store_evaluates_sparql(graph.store):
+                # Native engines reject prepared queries; let them parse it
+                result = graph.query(full_query)
+            else:
+                # Execute query, reusing the parsed form of repeated queries
+                result = graph.query(_prepare_query(full_query, namespaces))
 
             # Check if this is an ASK query (returns boolean) or SELECT (returns rows)
             # rdflib Result objects have a 'type' attribute
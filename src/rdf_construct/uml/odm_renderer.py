@@ -21,6 +21,8 @@ from typing import Optional
 from rdflib import Graph, URIRef, RDF, RDFS, Literal
 from rdflib.namespace import OWL, XSD
 
+from .renderer import plantuml_identifier, qname
+
 
 # ODM stereotype mappings for RDF/OWL concepts
 # These follow the OMG ODM 1.1 specification naming conventions
@@ -59,22 +61,6 @@ ODM_RELATIONSHIP_STEREOTYPES = {
 }
 
 
-def qname(graph: Graph, uri: URIRef) -> str:
-    """Get qualified name (prefix:local) for a URI.
-
-    Args:
-        graph: RDF graph with namespace bindings
-        uri: URI to convert to QName
-
-    Returns:
-        QName string (e.g., 'ex:Animal') or full URI if no prefix found
-    """
-    try:
-        return graph.namespace_manager.normalizeUri(uri)
-    except Exception:
-        return str(uri)
-
-
 def local_name(graph: Graph, uri: URIRef) -> str:
     """Get local name only (without prefix) for a URI.
 
@@ -97,26 +83,6 @@ def local_name(graph: Graph, uri: URIRef) -> str:
     return uri_str
 
 
-def plantuml_identifier(graph: Graph, uri: URIRef) -> str:
-    """Convert RDF URI to PlantUML identifier using dot notation.
-
-    PlantUML uses package.Class notation. This converts RDF QNames
-    to proper PlantUML identifiers.
-
-    Args:
-        graph: RDF graph with namespace bindings
-        uri: URI to convert
-
-    Returns:
-        PlantUML identifier string (e.g., 'ex.Animal')
-    """
-    qn = qname(graph, uri)
-    if ":" in qn:
-        prefix, local = qn.split(":", 1)
-        return f"{prefix}.{local}"
-    return qn
-
-
 def escape_plantuml(text: str) -> str:
     """Escape special characters for PlantUML.
 
@@ -784,6 +750,6 @@ def render_odm_plantuml(
     diagram = renderer.render()
 
     if output_path:
-        output_path.write_text(diagram, encoding="utf-8")
+        output_path.write_bytes(diagram.encode("utf-8"))
 
     return diagram
@@ -7,12 +7,45 @@ Renders RDF entities as PlantUML class diagrams where:
 - Datatype property values render as notes with dotted connections
 """
 
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from collections import defaultdict
 
 from rdflib import Graph, URIRef, RDF, RDFS, Literal
-from rdflib.namespace import OWL, XSD
+from rdflib.namespace import OWL, XSD, split_uri
+
+# Metaclass types that never render as rdf:type edges from instances
+_METACLASS_QNAMES = frozenset({
+    "owl:Class",
+    "rdfs:Class",
+    "owl:ObjectProperty",
+    "owl:DatatypeProperty",
+    "owl:AnnotationProperty",
+})
+
+# Class types that are shown in a class's stereotype
+_CLASS_TYPE_QNAMES = frozenset({"owl:Class", "rdfs:Class", "owl:Restriction"})
+
+# Property types shown in a property's stereotype, with their spot letter
+_PROPERTY_TYPE_SYMBOLS = {
+    "owl:ObjectProperty": "O",
+    "owl:DatatypeProperty": "D",
+    "owl:AnnotationProperty": "A",
+    "rdf:Property": "P",
+}
+
+# PlantUML arrow direction hints by layout arrow_direction
+_ARROW_DIRECTION_HINTS = {
+    "up": "u",
+    "down": "d",
+    "left": "l",
+    "right": "r",
+}
+
+# Characters rdflib refuses to abbreviate to a QName (see rdflib.term)
+_INVALID_URI_CHARS = frozenset('<>" {}|\\^`')
 
 
 def qname(graph: Graph, uri: URIRef) -> str:
@@ -52,8 +85,9 @@ def safe_label(graph: Graph, uri: URIRef, camelcase: bool = False) -> str:
         # Clean up label for PlantUML
         label = label.replace('"', "'").replace("\n", " ").strip()
 
-        # Convert spaces to camelCase only if requested (for property names)
-        if camelcase:
+        # Convert spaces to camelCase only if requested (for property names).
+        # An alphanumeric label has no whitespace, so there is nothing to join.
+        if camelcase and not label.isalnum():
             words = label.split()
             if len(words) > 1:
                 # Ensure first word is lowercase for camelCase properties
@@ -108,8 +142,11 @@ def plantuml_identifier(graph: Graph, uri: URIRef) -> str:
     Returns:
         PlantUML identifier string with dot notation
     """
-    qn = qname(graph, uri)
+    return _qname_to_identifier(qname(graph, uri))
+
 
+def _qname_to_identifier(qn: str) -> str:
+    """Convert a QName to PlantUML dot notation (see plantuml_identifier)."""
     # Convert prefix:local to prefix.local for PlantUML
     if ":" in qn:
         prefix, local = qn.split(":", 1)
@@ -162,21 +199,209 @@ class PlantUMLRenderer:
         self.layout = layout
         self._note_counter = 0  # For generating unique note IDs
 
+        # Arrow direction hint, fixed for the lifetime of the renderer
+        if layout and layout.arrow_direction:
+            self._arrow_direction = _ARROW_DIRECTION_HINTS.get(layout.arrow_direction, "u")
+        else:
+            self._arrow_direction = "u"  # Default: up (for top-to-bottom layout)
+
+        # Namespace -> prefix table for QName lookups that bypass the
+        # namespace manager. Namespaces that another binding extends are left
+        # out, since rdflib resolves those to the longest match.
+        bound = {str(ns): prefix for prefix, ns in graph.namespaces()}
+        self._prefix_table: dict[str, str] = {
+            ns: prefix
+            for ns, prefix in bound.items()
+            if not any(other != ns and other.startswith(ns) for other in bound)
+        }
+
+        # QName cache, seeded with every selected entity so that sorting can
+        # key on a plain dict lookup; other URIs are added lazily by _qn()
+        self._qname_cache: dict[URIRef, str] = {}
+        for entity_set in entities.values():
+            for uri in entity_set:
+                self._qn(uri)
+        # PlantUML identifiers, derived once per URI rather than per line
+        self._id_cache: dict[URIRef, str] = {
+            uri: _qname_to_identifier(qn) for uri, qn in self._qname_cache.items()
+        }
+        self._label_cache: dict[tuple[URIRef, bool], str] = {}
+
+        # Entity lists sorted by QName once, and reused by every render step
+        sort_key = self._qname_cache.__getitem__
+        self._sorted_classes = sorted(entities.get("classes", set()), key=sort_key)
+        self._sorted_object_props = sorted(
+            entities.get("object_properties", set()), key=sort_key
+        )
+        self._sorted_datatype_props = sorted(
+            entities.get("datatype_properties", set()), key=sort_key
+        )
+        self._properties = (
+            entities.get("object_properties", set()) |
+            entities.get("datatype_properties", set()) |
+            entities.get("annotation_properties", set())
+        )
+        self._sorted_properties = sorted(self._properties, key=sort_key)
+        self._sorted_instances = sorted(entities.get("instances", set()), key=sort_key)
+
+        # Domains and ranges of each selected property, queried once here
+        # rather than once per (class, property) pair while rendering
+        self._prop_domain_range: dict[URIRef, tuple[tuple, tuple]] = {
+            prop: (
+                tuple(graph.objects(prop, RDFS.domain)),
+                tuple(graph.objects(prop, RDFS.range)),
+            )
+            for prop in self._sorted_properties
+        }
+
+        # Reverse index: class -> datatype properties declaring it as domain
+        self._dt_props_by_domain: dict[URIRef, list[URIRef]] = defaultdict(list)
+        for prop in self._sorted_datatype_props:
+            for domain in self._prop_domain_range[prop][0]:
+                self._dt_props_by_domain[domain].append(prop)
+
+        # Note text ("label: type") for each datatype property with a range;
+        # it is the same for every class in the property's domain
+        self._dt_note_text: dict[URIRef, str] = {}
+        for prop in self._sorted_datatype_props:
+            ranges = self._prop_domain_range[prop][1]
+            if ranges:
+                range_type = self._qn(ranges[0])
+                # Simplify XSD types
+                if range_type.startswith("xsd:"):
+                    range_type = range_type[4:]
+                self._dt_note_text[prop] = f"{self._label(prop, camelcase=True)}: {range_type}"
+
+        classes = entities.get("classes", set())
+        instances = entities.get("instances", set())
+
+        # Domain and range classes of each property that are themselves
+        # selected, found by set intersection and kept in QName order
+        self._prop_class_links: list[tuple[URIRef, list[URIRef], list[URIRef]]] = []
+        for prop in self._sorted_properties:
+            domains, ranges = self._prop_domain_range[prop]
+            linked_domains = sorted(classes.intersection(domains), key=self._qn)
+            linked_ranges = sorted(classes.intersection(ranges), key=self._qn)
+            if linked_domains or linked_ranges:
+                self._prop_class_links.append((prop, linked_domains, linked_ranges))
+
+        # rdfs:subClassOf edges between selected classes, from a single
+        # predicate scan, in (child, parent) QName order
+        self._subclass_edges: list[tuple[URIRef, URIRef]] = sorted(
+            (
+                (child, parent)
+                for child, _, parent in graph.triples((None, RDFS.subClassOf, None))
+                if child in classes and parent in classes
+            ),
+            key=lambda edge: (self._qn(edge[0]), self._qn(edge[1])),
+        )
+
+        # Types of each selected instance from a single rdf:type scan, in
+        # QName order; used for stereotypes as well as rdf:type edges
+        self._instance_types: dict[URIRef, list[URIRef]] = {}
+        for subj, _, cls in graph.triples((None, RDF.type, None)):
+            if subj in instances:
+                self._instance_types.setdefault(subj, []).append(cls)
+        for types in self._instance_types.values():
+            types.sort(key=self._qn)
+
+        # rdf:type edges from selected instances to selected classes;
+        # metaclass types are never drawn as edges
+        self._typed_instances: list[tuple[URIRef, list[URIRef]]] = []
+        for instance in self._sorted_instances:
+            edge_types = [
+                cls
+                for cls in self._instance_types.get(instance, ())
+                if cls in classes and self._qn(cls) not in _METACLASS_QNAMES
+            ]
+            if edge_types:
+                self._typed_instances.append((instance, edge_types))
+
+        # Literal values of selected instances, keyed by instance then
+        # property; one predicate scan per datatype property
+        self._dt_values: dict[URIRef, dict[URIRef, list[Literal]]] = {}
+        for prop in self._sorted_datatype_props:
+            for subj, _, value in graph.triples((None, prop, None)):
+                if subj in instances and isinstance(value, Literal):
+                    self._dt_values.setdefault(subj, {}).setdefault(prop, []).append(value)
+
+    def _qn(self, uri: URIRef) -> str:
+        """Get the QName for a URI, normalising each URI only once.
+
+        Args:
+            uri: URI to convert to QName
+
+        Returns:
+            QName string, as returned by qname()
+        """
+        qn = self._qname_cache.get(uri)
+        if qn is None:
+            qn = self._lookup_qname(uri)
+            self._qname_cache[uri] = qn
+        return qn
+
+    def _lookup_qname(self, uri: URIRef) -> str:
+        """Resolve a QName from the prefix table, as normalizeUri would.
+
+        Falls back to qname() for anything the table cannot answer
+        (unbound namespaces, unsplittable or invalid URIs).
+
+        Args:
+            uri: URI to convert to QName
+
+        Returns:
+            QName string, as returned by qname()
+        """
+        uri_str = str(uri)
+        try:
+            namespace, local = split_uri(uri_str)
+        except ValueError:
+            return qname(self.graph, uri)
+
+        prefix = self._prefix_table.get(namespace)
+        if prefix is None or not _INVALID_URI_CHARS.isdisjoint(uri_str):
+            return qname(self.graph, uri)
+        return f"{prefix}:{local}"
+
+    def _id(self, uri: URIRef) -> str:
+        """Get the PlantUML identifier for a URI, deriving it only once.
+
+        Args:
+            uri: URI to convert
+
+        Returns:
+            PlantUML identifier, as returned by plantuml_identifier()
+        """
+        identifier = self._id_cache.get(uri)
+        if identifier is None:
+            identifier = _qname_to_identifier(self._qn(uri))
+            self._id_cache[uri] = identifier
+        return identifier
+
+    def _label(self, uri: URIRef, camelcase: bool = False) -> str:
+        """Get the display label for a URI, looking it up only once.
+
+        Args:
+            uri: URI to get label for
+            camelcase: Whether to convert spaces to camelCase
+
+        Returns:
+            Label string, as returned by safe_label()
+        """
+        key = (uri, camelcase)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = safe_label(self.graph, uri, camelcase=camelcase)
+            self._label_cache[key] = label
+        return label
+
     def _get_arrow_direction(self) -> str:
         """Get arrow direction hint from layout config.
 
         Returns:
             Direction string: 'u' (up), 'd' (down), 'l' (left), 'r' (right), or ''
         """
-        if self.layout and self.layout.arrow_direction:
-            direction_map = {
-                "up": "u",
-                "down": "d",
-                "left": "l",
-                "right": "r",
-            }
-            return direction_map.get(self.layout.arrow_direction, "u")
-        return "u"  # Default: up (for top-to-bottom layout)
+        return self._arrow_direction
 
     def _get_class_stereotype(self, cls: URIRef) -> str:
         """Get stereotype for a class entity.
@@ -190,11 +415,9 @@ class PlantUMLRenderer:
             Stereotype string like <<owl:Class>> or <<rdfs:Class>>
         """
         # Check if it's typed as owl:Class or rdfs:Class
-        types = list(self.graph.objects(cls, RDF.type))
-
-        for t in types:
-            type_qn = qname(self.graph, t)
-            if type_qn in ("owl:Class", "rdfs:Class", "owl:Restriction"):
+        for t in self.graph.objects(cls, RDF.type):
+            type_qn = self._qn(t)
+            if type_qn in _CLASS_TYPE_QNAMES:
                 return f"<< (C, #FFFFFF) {type_qn} >>"
 
         # Default to rdfs:Class if not explicitly typed
@@ -209,24 +432,10 @@ class PlantUMLRenderer:
         Returns:
             Stereotype string like <<owl:ObjectProperty>>
         """
-        types = list(self.graph.objects(prop, RDF.type))
-
-        for t in types:
-            type_qn = qname(self.graph, t)
-            if type_qn in (
-                "owl:ObjectProperty",
-                "owl:DatatypeProperty",
-                "owl:AnnotationProperty",
-                "rdf:Property",
-            ):
-                if type_qn == "owl:ObjectProperty":
-                    type_symbol = "O"
-                elif type_qn == "owl:DatatypeProperty":
-                    type_symbol = "D"
-                elif type_qn == "owl:AnnotationProperty":
-                    type_symbol = "A"
-                else:
-                    type_symbol = "P"
+        for t in self.graph.objects(prop, RDF.type):
+            type_qn = self._qn(t)
+            type_symbol = _PROPERTY_TYPE_SYMBOLS.get(type_qn)
+            if type_symbol is not None:
                 return f"<< ({type_symbol}, #FFFFFF) {type_qn} >>"
 
         # Default
@@ -235,7 +444,8 @@ class PlantUMLRenderer:
     def _get_instance_stereotype(self, instance: URIRef) -> str:
         """Get stereotype for an instance showing all its types.
 
-        For instances with multiple types, create comma-separated stereotype.
+        For instances with multiple types, create comma-separated stereotype
+        (selected instances list their types in QName order).
         Example: <<ies:Entity>> or <<building:Structure, ies:Asset>>
 
         Args:
@@ -244,15 +454,16 @@ class PlantUMLRenderer:
         Returns:
             Stereotype string with all types
         """
-        types = list(self.graph.objects(instance, RDF.type))
+        types = self._instance_types.get(instance)
+        if types is None:
+            types = self.graph.objects(instance, RDF.type)
 
         # Filter out property/class types (instances shouldn't have these)
         type_qnames = []
         for t in types:
-            type_qn = qname(self.graph, t)
+            type_qn = self._qn(t)
             # Skip metaclass types
-            if type_qn not in ("owl:Class", "rdfs:Class", "owl:ObjectProperty",
-                             "owl:DatatypeProperty", "owl:AnnotationProperty"):
+            if type_qn not in _METACLASS_QNAMES:
                 type_qnames.append(type_qn)
 
         if type_qnames:
@@ -275,7 +486,7 @@ class PlantUMLRenderer:
         """
         lines = []
 
-        class_name = plantuml_identifier(self.graph, cls)
+        class_name = self._id(cls)
         stereotype = self._get_class_stereotype(cls)
 
         # Get colour styling if configured
@@ -304,7 +515,7 @@ class PlantUMLRenderer:
         """
         lines = []
 
-        prop_name = plantuml_identifier(self.graph, prop)
+        prop_name = self._id(prop)
         stereotype = self._get_property_stereotype(prop)
 
         # Properties are typically gray
@@ -330,8 +541,8 @@ class PlantUMLRenderer:
         """
         lines = []
 
-        instance_name = plantuml_identifier(self.graph, instance)
-        instance_label = safe_label(self.graph, instance, camelcase=False)
+        instance_name = self._id(instance)
+        instance_label = self._label(instance, camelcase=False)
         stereotype = self._get_instance_stereotype(instance)
 
         # Get colour styling for instances
@@ -342,7 +553,7 @@ class PlantUMLRenderer:
                 color_spec = f" {palette.to_plantuml()}"
 
         # Render as class with stereotype and optional custom label
-        if instance_label != qname(self.graph, instance):
+        if instance_label != self._qn(instance):
             lines.append(f'class "{instance_label}" as {instance_name} {stereotype}{color_spec}')
         else:
             lines.append(f"class {instance_name} {stereotype}{color_spec}")
@@ -360,15 +571,13 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        for cls in self.entities.get("classes", set()):
-            for parent in self.graph.objects(cls, RDFS.subClassOf):
-                if parent in self.entities.get("classes", set()):
-                    child_name = plantuml_identifier(self.graph, cls)
-                    parent_name = plantuml_identifier(self.graph, parent)
+        for child, parent in self._subclass_edges:
+            child_name = self._id(child)
+            parent_name = self._id(parent)
 
-                    lines.append(
-                        f"{child_name} -{direction}-|> {parent_name} : <<rdfs:subClassOf>>"
-                    )
+            lines.append(
+                f"{child_name} -{direction}-|> {parent_name} : <<rdfs:subClassOf>>"
+            )
 
         return lines
 
@@ -381,18 +590,11 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        # Collect all properties
-        all_props = (
-            self.entities.get("object_properties", set()) |
-            self.entities.get("datatype_properties", set()) |
-            self.entities.get("annotation_properties", set())
-        )
-
-        for prop in all_props:
+        for prop in self._sorted_properties:
             for parent_prop in self.graph.objects(prop, RDFS.subPropertyOf):
-                if parent_prop in all_props:
-                    child_name = plantuml_identifier(self.graph, prop)
-                    parent_name = plantuml_identifier(self.graph, parent_prop)
+                if parent_prop in self._properties:
+                    child_name = self._id(prop)
+                    parent_name = self._id(parent_prop)
 
                     lines.append(
                         f"{child_name} -{direction}-|> {parent_name} : <<rdfs:subPropertyOf>>"
@@ -411,25 +613,18 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        for instance in self.entities.get("instances", set()):
-            instance_name = plantuml_identifier(self.graph, instance)
-
-            for cls in self.graph.objects(instance, RDF.type):
-                # Skip metaclass types
-                type_qn = qname(self.graph, cls)
-                if type_qn in ("owl:Class", "rdfs:Class", "owl:ObjectProperty",
-                               "owl:DatatypeProperty", "owl:AnnotationProperty"):
-                    continue
-
-                if cls in self.entities.get("classes", set()):
-                    class_name = plantuml_identifier(self.graph, cls)
+        # Get arrow color from style
+        arrow_color = "#FF0000"  # Default red
+        if self.style and hasattr(self.style, 'arrow_colors'):
+            arrow_color = self.style.arrow_colors.get_color("type")
 
-                    # Get arrow color from style
-                    arrow_color = "#FF0000"  # Default red
-                    if self.style and hasattr(self.style, 'arrow_colors'):
-                        arrow_color = self.style.arrow_colors.get_color("type")
+        # Only instances typed by a selected class have edges to draw
+        for instance, types in self._typed_instances:
+            instance_name = self._id(instance)
 
-                    lines.append(f"{instance_name} -{direction}[{arrow_color}]-> {class_name} : <<rdf:type>>")
+            for cls in types:
+                class_name = self._id(cls)
+                lines.append(f"{instance_name} -{direction}[{arrow_color}]-> {class_name} : <<rdf:type>>")
 
         return lines
 
@@ -444,64 +639,46 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        # Collect all properties
-        all_props = (
-            self.entities.get("object_properties", set()) |
-            self.entities.get("datatype_properties", set()) |
-            self.entities.get("annotation_properties", set())
-        )
-
-        for prop in all_props:
-            prop_name = plantuml_identifier(self.graph, prop)
-
-            # Render domain relationships
-            for domain in self.graph.objects(prop, RDFS.domain):
-                if domain in self.entities.get("classes", set()):
-                    domain_name = plantuml_identifier(self.graph, domain)
-                    lines.append(
-                        f"{prop_name} -{direction}-> {domain_name} : <<rdfs:domain>>"
-                    )
-
-            # Render range relationships
-            for range_cls in self.graph.objects(prop, RDFS.range):
-                # Check if range is a class (for object properties)
-                if range_cls in self.entities.get("classes", set()):
-                    range_name = plantuml_identifier(self.graph, range_cls)
-                    lines.append(
-                        f"{prop_name} -{direction}-> {range_name} : <<rdfs:range>>"
-                    )
-                # For datatype properties, range might be XSD type - skip those
+        # Only selected classes are linked; XSD ranges of datatype
+        # properties are filtered out by the intersection in __init__
+        for prop, domains, ranges in self._prop_class_links:
+            prop_name = self._id(prop)
+            for domain in domains:
+                lines.append(
+                    f"{prop_name} -{direction}-> {self._id(domain)} : <<rdfs:domain>>"
+                )
+            for range_cls in ranges:
+                lines.append(
+                    f"{prop_name} -{direction}-> {self._id(range_cls)} : <<rdfs:range>>"
+                )
 
         return lines
 
     def render_instance_object_properties(self) -> list[str]:
         """Render object property relationships between instances.
 
-        Black arrows labeled with property name (camelCase).
+        Black arrows labeled with the property QName.
 
         Returns:
             List of PlantUML relationship lines
         """
         lines = []
-        direction = self._get_arrow_direction()
+        arrow = f" -{self._get_arrow_direction()}-> "
 
-        obj_props = self.entities.get("object_properties", set())
         instances = self.entities.get("instances", set())
 
-        for subj in instances:
-            for prop in obj_props:
-                for obj in self.graph.objects(subj, prop):
-                    if obj in instances:
-                        subj_name = plantuml_identifier(self.graph, subj)
-                        obj_name = plantuml_identifier(self.graph, obj)
-                        prop_qname = qname(self.graph, prop)
+        # Edge labels depend only on the property, so build them once
+        edge_labels = [
+            (prop, f" : <<{self._qn(prop)}>>") for prop in self._sorted_object_props
+        ]
 
-                        # Ensure property name is camelCase
-                        prop_label = safe_label(self.graph, prop, camelcase=True)
+        for subj in self._sorted_instances:
+            subj_name = self._id(subj)
 
-                        lines.append(
-                            f"{subj_name} -{direction}-> {obj_name} : <<{prop_qname}>>"
-                        )
+            for prop, edge_label in edge_labels:
+                for obj in self.graph.objects(subj, prop):
+                    if obj in instances:
+                        lines.append(f"{subj_name}{arrow}{self._id(obj)}{edge_label}")
 
         return lines
 
@@ -516,30 +693,32 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        datatype_props = self.entities.get("datatype_properties", set())
-        instances = self.entities.get("instances", set())
+        for instance in self._sorted_instances:
+            values_by_prop = self._dt_values.get(instance)
+            if not values_by_prop:
+                continue
 
-        for instance in instances:
-            instance_name = plantuml_identifier(self.graph, instance)
+            instance_name = self._id(instance)
 
-            for prop in datatype_props:
-                for value in self.graph.objects(instance, prop):
-                    if isinstance(value, Literal):
-                        # Create unique note ID
-                        self._note_counter += 1
-                        note_id = f"N{self._note_counter}"
+            # Properties were inserted in sorted order, so this stays sorted
+            for prop, values in values_by_prop.items():
+                prop_qname = self._qn(prop)
 
-                        # Escape literal value for PlantUML
-                        value_str = escape_plantuml(str(value))
+                for value in values:
+                    # Create unique note ID
+                    self._note_counter += 1
+                    note_id = f"N{self._note_counter}"
 
-                        # Create note
-                        lines.append(f'note "{value_str}" as {note_id}')
+                    # Escape literal value for PlantUML
+                    value_str = escape_plantuml(str(value))
 
-                        # Connect with dotted line
-                        prop_qname = qname(self.graph, prop)
-                        lines.append(
-                            f"{instance_name} .{direction}. {note_id} : <<{prop_qname}>>"
-                        )
+                    # Create note
+                    lines.append(f'note "{value_str}" as {note_id}')
+
+                    # Connect with dotted line
+                    lines.append(
+                        f"{instance_name} .{direction}. {note_id} : <<{prop_qname}>>"
+                    )
 
         return lines
 
@@ -554,106 +733,97 @@ class PlantUMLRenderer:
         lines = []
         direction = self._get_arrow_direction()
 
-        datatype_props = self.entities.get("datatype_properties", set())
-        classes = self.entities.get("classes", set())
-
-        for cls in classes:
-            cls_name = plantuml_identifier(self.graph, cls)
+        for cls in self._sorted_classes:
+            cls_name = self._id(cls)
 
-            for prop in datatype_props:
-                # Check if this property has this class as domain
-                domains = list(self.graph.objects(prop, RDFS.domain))
-                if cls not in domains:
+            for prop in self._dt_props_by_domain.get(cls, ()):
+                # Only properties with a range get a note showing the type
+                note_text = self._dt_note_text.get(prop)
+                if note_text is None:
                     continue
 
-                # Get range to show type
-                ranges = list(self.graph.objects(prop, RDFS.range))
-                if ranges:
-                    # Create note showing the property and its type
-                    self._note_counter += 1
-                    note_id = f"N{self._note_counter}"
-
-                    range_type = qname(self.graph, ranges[0])
-                    # Simplify XSD types
-                    if range_type.startswith("xsd:"):
-                        range_type = range_type[4:]
+                self._note_counter += 1
+                note_id = f"N{self._note_counter}"
 
-                    prop_label = safe_label(self.graph, prop, camelcase=True)
+                lines.append(f'note "{note_text}" as {note_id}')
 
-                    lines.append(f'note "{prop_label}: {range_type}" as {note_id}')
-
-                    prop_qname = qname(self.graph, prop)
-                    lines.append(
-                        f"{cls_name} .{direction}. {note_id} : <<{prop_qname}>>"
-                    )
+                prop_qname = self._qn(prop)
+                lines.append(
+                    f"{cls_name} .{direction}. {note_id} : <<{prop_qname}>>"
+                )
 
         return lines
 
-    def render(self) -> str:
-        """Render complete PlantUML diagram.
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the lines of the complete PlantUML diagram.
 
-        Returns:
-            Complete PlantUML diagram as string
+        Each section is rendered only when the previous one has been
+        consumed, so callers writing straight to a file never hold more
+        than one section in memory.
+
+        Yields:
+            PlantUML lines, without trailing newlines
         """
-        lines = ["@startuml", ""]
+        yield "@startuml"
+        yield ""
 
         # Add layout directives
         if self.layout:
-            directives = getattr(self.layout, 'get_plantuml_directives', lambda: [])()
-            lines.extend(directives)
-            lines.append("")
+            yield from getattr(self.layout, 'get_plantuml_directives', lambda: [])()
+            yield ""
 
         # Add style directives
         if self.style:
             directives = getattr(self.style, 'get_plantuml_directives', lambda: [])()
             if directives:
-                lines.extend(directives)
-                lines.append("")
+                yield from directives
+                yield ""
 
         # Render all classes
-        for cls in sorted(self.entities.get("classes", set()), key=lambda x: qname(self.graph, x)):
-            lines.extend(self.render_class(cls))
+        for cls in self._sorted_classes:
+            yield from self.render_class(cls)
 
-        if self.entities.get("classes"):
-            lines.append("")
+        if self._sorted_classes:
+            yield ""
 
         # Render all properties as classes
-        all_props = (
-            self.entities.get("object_properties", set()) |
-            self.entities.get("datatype_properties", set()) |
-            self.entities.get("annotation_properties", set())
-        )
-        for prop in sorted(all_props, key=lambda x: qname(self.graph, x)):
-            lines.extend(self.render_property(prop))
+        for prop in self._sorted_properties:
+            yield from self.render_property(prop)
 
-        if all_props:
-            lines.append("")
+        if self._sorted_properties:
+            yield ""
 
         # Render all instances as classes
-        for instance in sorted(self.entities.get("instances", set()), key=lambda x: qname(self.graph, x)):
-            lines.extend(self.render_instance(instance))
+        for instance in self._sorted_instances:
+            yield from self.render_instance(instance)
 
-        if self.entities.get("instances"):
-            lines.append("")
+        if self._sorted_instances:
+            yield ""
 
         # Render relationships
-        lines.extend(self.render_subclass_relationships())
-        lines.extend(self.render_subproperty_relationships())
-        lines.extend(self.render_type_relationships())
-        lines.extend(self.render_property_domain_range())
-        lines.extend(self.render_instance_object_properties())
+        yield from self.render_subclass_relationships()
+        yield from self.render_subproperty_relationships()
+        yield from self.render_type_relationships()
+        yield from self.render_property_domain_range()
+        yield from self.render_instance_object_properties()
 
-        if any([self.entities.get("classes"), all_props, self.entities.get("instances")]):
-            lines.append("")
+        if self._sorted_classes or self._sorted_properties or self._sorted_instances:
+            yield ""
 
         # Render datatype properties as notes
-        lines.extend(self.render_instance_datatype_properties())
-        lines.extend(self.render_class_datatype_properties())
+        yield from self.render_instance_datatype_properties()
+        yield from self.render_class_datatype_properties()
 
-        lines.append("")
-        lines.append("@enduml")
+        yield ""
+        yield "@enduml"
+
+    def render(self) -> str:
+        """Render complete PlantUML diagram.
 
-        return "\n".join(lines)
+        Returns:
+            Complete PlantUML diagram as string
+        """
+        return "\n".join(self.iter_lines())
 
 
 def render_plantuml(
@@ -679,6 +849,36 @@ def render_plantuml(
     diagram = renderer.render()
 
     if output_path:
-        output_path.write_text(diagram)
+        _write_atomic(Path(output_path), diagram.encode("utf-8"))
 
     return diagram
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a file by swapping in a completed temp file.
+
+    Readers (e.g. a PlantUML previewer watching the file) never see a
+    partial diagram. The temp file is uniquely named in the same
+    directory, so concurrent writes to one path don't share it, and it
+    is removed if the write or the swap fails.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    tmp_path = Path(tmp.name)
+    try:
+        with tmp:
+            tmp.write(data)
+        # NamedTemporaryFile creates the file as 0600; give the output the
+        # permissions a plain open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -10,12 +10,18 @@ Enhanced features:
 - layout_hints: Hidden links to influence positioning
 """
 
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal, Optional
+from types import MappingProxyType
+from typing import Any, Final, Literal, Mapping, Optional
 
 import yaml
 
+# Prefer libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 LayoutDirection = Literal[
     "top_to_bottom",
@@ -26,6 +32,31 @@ LayoutDirection = Literal[
 
 LineType = Literal["ortho", "polyline", "spline"]
 
+# Accepted spellings of each layout direction (keys are lowercase)
+_DIRECTION_ALIASES: Final[Mapping[str, LayoutDirection]] = MappingProxyType({
+    "top_to_bottom": "top_to_bottom",
+    "ttb": "top_to_bottom",
+    "tb": "top_to_bottom",
+    "bottom_to_top": "bottom_to_top",
+    "btt": "bottom_to_top",
+    "bt": "bottom_to_top",
+    "left_to_right": "left_to_right",
+    "ltr": "left_to_right",
+    "lr": "left_to_right",
+    "right_to_left": "right_to_left",
+    "rtl": "right_to_left",
+    "rl": "right_to_left",
+})
+
+_ARROW_DIRECTIONS: Final[frozenset[str]] = frozenset({"up", "down", "left", "right"})
+
+# Arrow head glyphs by relationship type (unknown types use ">")
+_ARROW_GLYPHS: Final[Mapping[str, str]] = MappingProxyType({
+    "subclass": "|>",  # Inheritance (triangle)
+    "instance": "|>",  # Instance-of (typically dotted)
+    "object_property": ">",  # Association
+})
+
 
 @dataclass
 class LayoutHint:
@@ -109,6 +140,14 @@ class LayoutConfig:
                     weight=hint.get("weight", 1),
                 ))
 
+        # Arrow syntax depends only on settings fixed above, so build the
+        # table once instead of on every get_arrow_syntax() call
+        self._arrow_syntax = {
+            relationship_type: self._build_arrow_syntax(relationship_type)
+            for relationship_type in _ARROW_GLYPHS
+        }
+        self._default_arrow_syntax = self._build_arrow_syntax("")
+
     def _validate_direction(self, direction: str) -> LayoutDirection:
         """Validate and normalize layout direction.
 
@@ -118,23 +157,7 @@ class LayoutConfig:
         Returns:
             Validated LayoutDirection
         """
-        direction_map = {
-            "top_to_bottom": "top_to_bottom",
-            "ttb": "top_to_bottom",
-            "tb": "top_to_bottom",
-            "bottom_to_top": "bottom_to_top",
-            "btt": "bottom_to_top",
-            "bt": "bottom_to_top",
-            "left_to_right": "left_to_right",
-            "ltr": "left_to_right",
-            "lr": "left_to_right",
-            "right_to_left": "right_to_left",
-            "rtl": "right_to_left",
-            "rl": "right_to_left",
-        }
-
-        normalized = direction_map.get(direction.lower(), "top_to_bottom")
-        return normalized  # type: ignore
+        return _DIRECTION_ALIASES.get(direction.lower(), "top_to_bottom")
 
     def _validate_arrow_direction(self, arrow_dir: str) -> str:
         """Validate arrow direction hint.
@@ -145,9 +168,9 @@ class LayoutConfig:
         Returns:
             Validated arrow direction ('up', 'down', 'left', 'right')
         """
-        valid_directions = {"up", "down", "left", "right"}
-        if arrow_dir.lower() in valid_directions:
-            return arrow_dir.lower()
+        arrow_dir = arrow_dir.lower()
+        if arrow_dir in _ARROW_DIRECTIONS:
+            return arrow_dir
         return "up"  # Default: parents above children
 
     def _validate_linetype(self, linetype: Optional[str]) -> Optional[LineType]:
@@ -179,24 +202,28 @@ class LayoutConfig:
             relationship_type: Type of relationship ('subclass', 'instance',
                              'object_property', etc.)
 
+        Returns:
+            PlantUML arrow syntax with optional direction hint
+        """
+        return self._arrow_syntax.get(relationship_type, self._default_arrow_syntax)
+
+    def _build_arrow_syntax(self, relationship_type: str) -> str:
+        """Build the arrow syntax returned by get_arrow_syntax().
+
+        Args:
+            relationship_type: Type of relationship
+
         Returns:
             PlantUML arrow syntax with optional direction hint
         """
         if not self.show_arrows:
             return "--"
 
-        # Map relationship types to arrow styles
-        arrow_map = {
-            "subclass": "|>",  # Inheritance (triangle)
-            "instance": "|>",  # Instance-of (typically dotted)
-            "object_property": ">",  # Association
-        }
-
-        arrow_glyph = arrow_map.get(relationship_type, ">")
+        arrow_glyph = _ARROW_GLYPHS.get(relationship_type, ">")
 
         # Add direction hint for hierarchical relationships
         if relationship_type in ("subclass", "instance"):
-            if self.arrow_direction in ("up", "down", "left", "right"):
+            if self.arrow_direction in _ARROW_DIRECTIONS:
                 return f"-{self.arrow_direction}-{arrow_glyph}"
 
         # Default: no direction hint
@@ -321,6 +348,26 @@ class LayoutConfig:
         )
 
 
+@lru_cache(maxsize=32)
+def _parse_layout_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a layout YAML file, cached by resolved path, mtime and size.
+
+    The mtime and size are part of the cache key so that edits to the
+    file are picked up; they are otherwise unused.
+
+    Args:
+        path: Resolved path to the YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed YAML content
+    """
+    # Stream the raw bytes; the parser decodes UTF-8 as it reads
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 class LayoutConfigManager:
     """Manager for layout configurations.
 
@@ -338,8 +385,11 @@ class LayoutConfigManager:
         Args:
             yaml_path: Path to YAML layout configuration file
         """
-        yaml_path = Path(yaml_path)
-        self.config = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+        yaml_path = Path(yaml_path).resolve()
+        stat = yaml_path.stat()
+        parsed = _parse_layout_yaml(str(yaml_path), stat.st_mtime_ns, stat.st_size)
+        # Copy so callers can't mutate the cached parse result
+        self.config = copy.deepcopy(parsed)
 
         self.defaults = self.config.get("defaults", {}) or {}
 
@@ -6,13 +6,38 @@ RDF entity types based on their semantic roles.
 Added instance-specific styling based on rdf:type hierarchy.
 """
 
+import copy
+import json
+import os
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import yaml
 from rdflib import Graph, URIRef, RDF, RDFS
 from rdflib.namespace import OWL
 
+# Prefer libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Set to "1" to keep a JSON copy of each parsed style file next to it,
+# which is faster to load than YAML on later runs
+STYLE_CACHE_ENV = "RDF_CONSTRUCT_CACHE_YAML"
+
+# Metaclass types, which describe schema entities rather than instances
+_METACLASS_TYPES = frozenset({
+    OWL.Class, RDFS.Class,
+    OWL.ObjectProperty, OWL.DatatypeProperty,
+    OWL.AnnotationProperty, RDF.Property,
+})
+_METACLASS_QNAMES = frozenset({
+    "owl:Class", "rdfs:Class",
+    "owl:ObjectProperty", "owl:DatatypeProperty",
+    "owl:AnnotationProperty", "rdf:Property",
+})
+
 
 class ColorPalette:
     """Color definitions for a single entity type.
@@ -24,6 +49,8 @@ class ColorPalette:
         line_style: Line style (e.g., 'bold', 'dashed', 'dotted')
     """
 
+    __slots__ = ("border", "fill", "text", "line_style", "_plantuml")
+
     def __init__(self, config: dict[str, Any]):
         """Initialise colour palette from configuration.
 
@@ -34,6 +61,8 @@ class ColorPalette:
         self.fill = config.get("fill", "#FFFFFF")
         self.text = config.get("text")
         self.line_style = config.get("line_style")
+        # Palettes are immutable once loaded, so the spec is built only once
+        self._plantuml = self._build_plantuml()
 
     def to_plantuml(self) -> str:
         """Generate PlantUML color specification.
@@ -41,6 +70,14 @@ class ColorPalette:
         Returns string in format: #back:FILL;line:BORDER;line.STYLE;text:TEXT
         Not just #FILL
 
+        Returns:
+            PlantUML color spec string with # prefix, or empty if no styling
+        """
+        return self._plantuml
+
+    def _build_plantuml(self) -> str:
+        """Build the PlantUML color specification returned by to_plantuml().
+
         Returns:
             PlantUML color spec string with # prefix, or empty if no styling
         """
@@ -70,6 +107,14 @@ class ColorPalette:
         return f"#{';'.join(parts)}" if parts else ""
 
 
+# Fallback palette for properties without a namespace or type style
+_DEFAULT_PROPERTY_STYLE = ColorPalette({
+    "fill": "#CCCCCC",
+    "border": "#666666",
+    "text": "#000000"
+})
+
+
 class ArrowStyle:
     """Style specification for relationship arrows.
 
@@ -80,6 +125,8 @@ class ArrowStyle:
         label_color: Color for relationship labels
     """
 
+    __slots__ = ("color", "thickness", "style", "label_color", "_directive")
+
     def __init__(self, config: dict[str, Any]):
         """Initialize arrow style from configuration.
 
@@ -90,10 +137,20 @@ class ArrowStyle:
         self.thickness = config.get("thickness")
         self.style = config.get("style")
         self.label_color = config.get("label_color")
+        # Arrow styles are immutable once loaded, so build the directive once
+        self._directive = self._build_directive()
 
     def to_plantuml_directive(self) -> Optional[str]:
         """Generate PlantUML skinparam directive for this arrow style.
 
+        Returns:
+            Skinparam directive or None if no customization needed
+        """
+        return self._directive
+
+    def _build_directive(self) -> Optional[str]:
+        """Build the directive returned by to_plantuml_directive().
+
         Returns:
             Skinparam directive or None if no customization needed
         """
@@ -155,6 +212,50 @@ class ArrowColorConfig:
         return color_map.get(relationship_type, "#000000")
 
 
+# Cache sentinel, distinguishing "no style" (None) from "not looked up"
+_MISS = object()
+
+
+class _GraphIndex:
+    """Lookups derived from one graph, shared by every style query on it.
+
+    Attributes:
+        graph_ref: Weak reference to the indexed graph
+        parents: Direct superclasses of each class visited so far
+        ancestors: Superclasses of each class, in lookup order
+        qnames: QName of each URI normalised so far
+        styles: Resolved palette (or None) per (URI, is_instance) pair
+    """
+
+    def __init__(self, graph: Graph):
+        """Create an empty index for a graph.
+
+        Args:
+            graph: RDF graph being styled
+        """
+        self.graph_ref = weakref.ref(graph)
+        self.parents: dict[URIRef, list[URIRef]] = {}
+        self.ancestors: dict[URIRef, list[URIRef]] = {}
+        self.qnames: dict[URIRef, str] = {}
+        self.styles: dict[tuple[URIRef, bool], Optional[ColorPalette]] = {}
+
+    def qname(self, uri: URIRef) -> str:
+        """Get the QName for a URI, normalising each URI only once.
+
+        Args:
+            uri: URI to convert to QName
+
+        Returns:
+            QName string, as returned by normalizeUri()
+        """
+        qn = self.qnames.get(uri)
+        if qn is None:
+            # Only reached through _graph_index(graph), so the graph is alive
+            qn = self.graph_ref().namespace_manager.normalizeUri(uri)
+            self.qnames[uri] = qn
+        return qn
+
+
 class StyleScheme:
     """Complete styling scheme for UML diagrams.
 
@@ -169,6 +270,26 @@ class StyleScheme:
         stereotype_map: Mapping of RDF types to stereotype labels
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "_ns_styles",
+        "_type_styles",
+        "_default_style",
+        "_class_styles",
+        "_instance_config",
+        "_instance_styles",
+        "_instance_style_default",
+        "instance_inherit_class_border",
+        "instance_inherit_class_text",
+        "arrow_styles",
+        "arrow_colors",
+        "show_stereotypes",
+        "stereotype_map",
+        "_graph_indexes",
+        "_class_resolvers",
+    )
+
     def __init__(self, name: str, config: dict[str, Any]):
         """Initialise style scheme from configuration.
 
@@ -179,43 +300,34 @@ class StyleScheme:
         self.name = name
         self.description = config.get("description", "")
 
-        # Class styling
+        # Class styling, indexed separately by namespace prefix and by type
+        # QName so lookups need no prefixed key strings
         class_config = config.get("classes", {})
-        self.class_styles = {}
 
         # By namespace
-        by_namespace = class_config.get("by_namespace", {})
-        for ns_prefix, palette_config in by_namespace.items():
-            self.class_styles[f"ns:{ns_prefix}"] = ColorPalette(palette_config)
+        self._ns_styles: dict[str, ColorPalette] = {
+            ns_prefix: ColorPalette(palette_config)
+            for ns_prefix, palette_config in class_config.get("by_namespace", {}).items()
+        }
 
         # By type (for specific classes)
-        by_type = class_config.get("by_type", {})
-        for type_key, palette_config in by_type.items():
-            self.class_styles[f"type:{type_key}"] = ColorPalette(palette_config)
+        self._type_styles: dict[str, ColorPalette] = {
+            type_key: ColorPalette(palette_config)
+            for type_key, palette_config in class_config.get("by_type", {}).items()
+        }
 
         # Default class style
-        if "default" in class_config:
-            self.class_styles["default"] = ColorPalette(class_config["default"])
+        self._default_style: Optional[ColorPalette] = (
+            ColorPalette(class_config["default"]) if "default" in class_config else None
+        )
+        self._class_styles: Optional[Mapping[str, ColorPalette]] = None
 
-        # Instance styling
+        # Instance styling; palettes are built on first use, since many
+        # diagrams draw no instances
         instance_config = config.get("instances", {})
-        self.instance_styles = {}
-
-        # Load by_type instance styles
-        by_type_instances = instance_config.get("by_type", {})
-        for type_key, palette_config in by_type_instances.items():
-            self.instance_styles[f"type:{type_key}"] = ColorPalette(palette_config)
-
-        # Default instance style (fallback if no by_type match)
-        if "default" in instance_config:
-            self.instance_style_default = ColorPalette(instance_config["default"])
-        else:
-            # Legacy support: if no 'default' key but instance_config has color keys
-            # treat the whole config as a palette
-            if any(k in instance_config for k in ["border", "fill", "text"]):
-                self.instance_style_default = ColorPalette(instance_config)
-            else:
-                self.instance_style_default = None
+        self._instance_config = instance_config
+        self._instance_styles: Optional[Mapping[str, ColorPalette]] = None
+        self._instance_style_default: Optional[ColorPalette] = None
 
         # Legacy support for inherit_class_border flag
         self.instance_inherit_class_border = instance_config.get(
@@ -228,9 +340,10 @@ class StyleScheme:
 
         # Arrow styling
         arrow_config = config.get("arrows", {})
-        self.arrow_styles = {}
-        for arrow_type, arrow_cfg in arrow_config.items():
-            self.arrow_styles[arrow_type] = ArrowStyle(arrow_cfg)
+        self.arrow_styles: Mapping[str, ArrowStyle] = MappingProxyType({
+            arrow_type: ArrowStyle(arrow_cfg)
+            for arrow_type, arrow_cfg in arrow_config.items()
+        })
 
         # Arrow color configuration
         arrow_color_config = config.get("arrow_colors", {})
@@ -238,7 +351,93 @@ class StyleScheme:
 
         # Stereotype configuration
         self.show_stereotypes = config.get("show_stereotypes", False)
-        self.stereotype_map = config.get("stereotype_map", {})
+        self.stereotype_map: Mapping[str, str] = MappingProxyType(
+            dict(config.get("stereotype_map", {}))
+        )
+
+        # Per-graph lookup indexes, keyed by id(graph). Lookups are cached
+        # there, which is why the style mappings above are read-only views
+        self._graph_indexes: dict[int, _GraphIndex] = {}
+
+        # Class style resolvers in priority order, leaving out any that have
+        # no styles to find; the default style is the final fallback
+        self._class_resolvers = tuple(
+            resolver
+            for resolver, enabled in (
+                (self._resolve_type_style, bool(self._type_styles)),
+                (self._resolve_inherited_style, bool(self._type_styles)),
+                (self._resolve_namespace_style, bool(self._ns_styles)),
+            )
+            if enabled
+        )
+
+    @property
+    def class_styles(self) -> Mapping[str, ColorPalette]:
+        """All class styles keyed as "ns:<prefix>", "type:<qname>" or "default".
+
+        Built on first access from the separate namespace and type indexes.
+        """
+        if self._class_styles is None:
+            styles = {f"ns:{prefix}": p for prefix, p in self._ns_styles.items()}
+            styles.update((f"type:{qn}", p) for qn, p in self._type_styles.items())
+            if self._default_style is not None:
+                styles["default"] = self._default_style
+            self._class_styles = MappingProxyType(styles)
+        return self._class_styles
+
+    @property
+    def instance_styles(self) -> Mapping[str, ColorPalette]:
+        """Instance styles keyed as "type:<qname>", built on first access."""
+        if self._instance_styles is None:
+            self._load_instance_styles()
+        return self._instance_styles
+
+    @property
+    def instance_style_default(self) -> Optional[ColorPalette]:
+        """Fallback instance style, built on first access."""
+        if self._instance_styles is None:
+            self._load_instance_styles()
+        return self._instance_style_default
+
+    def _load_instance_styles(self) -> None:
+        """Build the instance palettes from the stored instance configuration."""
+        instance_config = self._instance_config
+
+        # Load by_type instance styles
+        by_type_instances = instance_config.get("by_type", {})
+        self._instance_styles = MappingProxyType({
+            f"type:{type_key}": ColorPalette(palette_config)
+            for type_key, palette_config in by_type_instances.items()
+        })
+
+        # Default instance style (fallback if no by_type match)
+        if "default" in instance_config:
+            self._instance_style_default = ColorPalette(instance_config["default"])
+        else:
+            # Legacy support: if no 'default' key but instance_config has color keys
+            # treat the whole config as a palette
+            if any(k in instance_config for k in ["border", "fill", "text"]):
+                self._instance_style_default = ColorPalette(instance_config)
+            else:
+                self._instance_style_default = None
+
+    def _graph_index(self, graph: Graph) -> _GraphIndex:
+        """Get the lookup index for a graph, creating it on first use.
+
+        Args:
+            graph: RDF graph being styled
+
+        Returns:
+            _GraphIndex for the graph
+        """
+        index = self._graph_indexes.get(id(graph))
+        # A dead reference means the id has been reused by a new graph
+        if index is None or index.graph_ref() is not graph:
+            index = _GraphIndex(graph)
+            self._graph_indexes[id(graph)] = index
+            # Drop the index with its graph so short-lived graphs don't leak
+            weakref.finalize(graph, self._graph_indexes.pop, id(graph), None)
+        return index
 
     def get_class_style(
             self, graph: Graph, cls: URIRef, is_instance: bool = False
@@ -252,6 +451,29 @@ class StyleScheme:
         4. Namespace-based coloring (by_namespace)
         5. Default class style
 
+        Args:
+            graph: RDF graph containing the class
+            cls: Class URI
+            is_instance: Whether this is an instance rather than a class
+
+        Returns:
+            ColorPalette or None if no style defined
+        """
+        styles = self._graph_index(graph).styles
+        key = (cls, is_instance)
+        style = styles.get(key, _MISS)
+        if style is _MISS:
+            style = self._resolve_class_style(graph, cls, is_instance)
+            styles[key] = style
+        return style
+
+    def _resolve_class_style(
+            self, graph: Graph, cls: URIRef, is_instance: bool
+    ) -> Optional[ColorPalette]:
+        """Resolve the palette for a class or instance, uncached.
+
+        See get_class_style() for the selection priority.
+
         Args:
             graph: RDF graph containing the class
             cls: Class URI
@@ -264,27 +486,61 @@ class StyleScheme:
         if is_instance:
             return self.get_instance_style(graph, cls)
 
-        # Priority 2: Check for explicit type mapping
-        qn = graph.namespace_manager.normalizeUri(cls)
-        type_key = f"type:{qn}"
-        if type_key in self.class_styles:
-            return self.class_styles[type_key]
+        # Priorities 2-4: type, inherited and namespace styles
+        qn = self._qn(graph, cls)
+        for resolver in self._class_resolvers:
+            style = resolver(graph, cls, qn)
+            if style is not None:
+                return style
 
-        # Priority 3: INHERITANCE-BASED LOOKUP
-        # Walk up rdfs:subClassOf hierarchy to find styled superclass
-        style = self._get_inherited_style(graph, cls)
-        if style:
-            return style
+        # Priority 5: Default
+        return self._default_style
 
-        # Priority 4: Namespace-based coloring
-        if ":" in qn:
-            ns_prefix = qn.split(":")[0]
-            ns_key = f"ns:{ns_prefix}"
-            if ns_key in self.class_styles:
-                return self.class_styles[ns_key]
+    def _resolve_type_style(
+            self, graph: Graph, cls: URIRef, qn: str
+    ) -> Optional[ColorPalette]:
+        """Look up an explicit type mapping (by_type) for a class.
 
-        # Priority 5: Default
-        return self.class_styles.get("default")
+        Args:
+            graph: RDF graph containing the class
+            cls: Class URI
+            qn: QName of the class
+
+        Returns:
+            ColorPalette or None if the class has no type style
+        """
+        return self._type_styles.get(qn)
+
+    def _resolve_inherited_style(
+            self, graph: Graph, cls: URIRef, qn: str
+    ) -> Optional[ColorPalette]:
+        """Look up the type style of the nearest styled superclass.
+
+        Args:
+            graph: RDF graph containing the class
+            cls: Class URI
+            qn: QName of the class
+
+        Returns:
+            ColorPalette or None if no superclass has a type style
+        """
+        return self._get_inherited_style(graph, cls)
+
+    def _resolve_namespace_style(
+            self, graph: Graph, cls: URIRef, qn: str
+    ) -> Optional[ColorPalette]:
+        """Look up the namespace style (by_namespace) for a class.
+
+        Args:
+            graph: RDF graph containing the class
+            cls: Class URI
+            qn: QName of the class
+
+        Returns:
+            ColorPalette or None if the class's namespace has no style
+        """
+        ns_prefix, sep, _ = qn.partition(":")
+        return self._ns_styles.get(ns_prefix) if sep else None
 
     def get_instance_style(
             self, graph: Graph, instance: URIRef
@@ -306,24 +562,18 @@ class StyleScheme:
         Returns:
             ColorPalette for the instance, or None if no style defined
         """
-        # Get all rdf:type declarations for this instance
-        instance_types = list(graph.objects(instance, RDF.type))
-
-        # Filter out metaclass types that shouldn't affect instance styling
-        metaclass_types = {
-            OWL.Class, RDFS.Class,
-            OWL.ObjectProperty, OWL.DatatypeProperty,
-            OWL.AnnotationProperty, RDF.Property
-        }
-        valid_types = [t for t in instance_types if t not in metaclass_types]
+        # Use the first declared rdf:type as primary, skipping metaclass
+        # types that shouldn't affect instance styling
+        primary_type = next(
+            (t for t in graph.objects(instance, RDF.type) if t not in _METACLASS_TYPES),
+            None,
+        )
 
-        if not valid_types:
+        if primary_type is None:
             # No valid types - use default
             return self.instance_style_default
 
-        # Use the first declared type as primary
-        primary_type = valid_types[0]
-        primary_type_qn = graph.namespace_manager.normalizeUri(primary_type)
+        primary_type_qn = self._qn(graph, primary_type)
 
         # Priority 1: Check for explicit instance type styling
         type_key = f"type:{primary_type_qn}"
@@ -389,8 +639,74 @@ class StyleScheme:
 
         return base_palette
 
+    def _qn(self, graph: Graph, uri: URIRef) -> str:
+        """Get the QName for a URI, normalising each URI once per graph.
+
+        Args:
+            graph: RDF graph whose namespace bindings apply
+            uri: URI to convert to QName
+
+        Returns:
+            QName string, as returned by normalizeUri()
+        """
+        return self._graph_index(graph).qname(uri)
+
+    def _get_ancestors(self, graph: Graph, cls: URIRef) -> list[URIRef]:
+        """Get the superclasses of a class in inheritance lookup order.
+
+        Superclasses are listed depth-first, in the order rdf:subClassOf
+        declares them, so the nearest styled ancestor along the first
+        branch wins. Blank nodes are skipped and cycles are cut. The
+        result is computed once per class and graph.
+
+        Args:
+            graph: RDF graph containing the class hierarchy
+            cls: Class URI to find ancestors for
+
+        Returns:
+            List of ancestor class URIs
+        """
+        index = self._graph_index(graph)
+        ancestors = index.ancestors.get(cls)
+        if ancestors is not None:
+            return ancestors
+
+        parents = index.parents
+
+        def direct_superclasses(c: URIRef) -> list[URIRef]:
+            supers = parents.get(c)
+            if supers is None:
+                supers = [
+                    s for s in graph.objects(c, RDFS.subClassOf)
+                    if isinstance(s, URIRef)
+                ]
+                parents[c] = supers
+            return supers
+
+        # Graph.transitive_objects() gives the same depth-first order, but
+        # it nests one generator per level (hitting the recursion limit on
+        # deep hierarchies) and walks through blank nodes, so iterate here
+        ancestors = []
+        listed = set()
+        visited = {cls}
+        stack = [iter(direct_superclasses(cls))]
+        while stack:
+            for superclass in stack[-1]:
+                if superclass not in listed:
+                    listed.add(superclass)
+                    ancestors.append(superclass)
+                if superclass not in visited:
+                    visited.add(superclass)
+                    stack.append(iter(direct_superclasses(superclass)))
+                    break
+            else:
+                stack.pop()
+
+        index.ancestors[cls] = ancestors
+        return ancestors
+
     def _get_inherited_style(
-            self, graph: Graph, cls: URIRef, visited: Optional[set] = None
+            self, graph: Graph, cls: URIRef
     ) -> Optional[ColorPalette]:
         """Walk up rdfs:subClassOf hierarchy to find styled superclass.
 
@@ -401,40 +717,15 @@ class StyleScheme:
         Args:
             graph: RDF graph containing the class hierarchy
             cls: Class URI to find style for
-            visited: Set of already-visited classes (prevents infinite loops)
 
         Returns:
             ColorPalette from nearest styled superclass, or None
         """
-        if visited is None:
-            visited = set()
-
-        # Prevent infinite loops in case of circular inheritance
-        if cls in visited:
-            return None
-        visited.add(cls)
-
-        # Get all direct superclasses
-        superclasses = list(graph.objects(cls, RDFS.subClassOf))
-
-        # Check each superclass
-        for superclass in superclasses:
-            # Skip if not a proper URI (could be blank node)
-            if not isinstance(superclass, URIRef):
-                continue
-
-            # Check if this superclass has explicit styling
-            super_qn = graph.namespace_manager.normalizeUri(superclass)
-            type_key = f"type:{super_qn}"
-
-            if type_key in self.class_styles:
-                # Found a styled superclass!
-                return self.class_styles[type_key]
-
-            # Recursively check this superclass's parents
-            inherited = self._get_inherited_style(graph, superclass, visited)
-            if inherited:
-                return inherited
+        qname = self._graph_index(graph).qname
+        for superclass in self._get_ancestors(graph, cls):
+            style = self._type_styles.get(qname(superclass))
+            if style is not None:
+                return style
 
         # No styled superclass found
         return None
@@ -455,33 +746,29 @@ class StyleScheme:
             Color palette for the property, or None for default styling
         """
         # Check for property-specific styling first
-        # Get QName using graph's namespace manager
-        prop_qname = graph.namespace_manager.normalizeUri(prop)
-        if prop_qname in self.class_styles:
-            return self.class_styles[prop_qname]
+        # Get QName (cached per graph)
+        prop_qname = self._qn(graph, prop)
+        style = self.class_styles.get(prop_qname)
+        if style is not None:
+            return style
 
         # Check namespace-based styling
-        if ":" in prop_qname:
-            ns_prefix = prop_qname.split(":")[0]
-            ns_key = f"ns:{ns_prefix}"
-            if ns_key in self.class_styles:
-                return self.class_styles[ns_key]
+        ns_prefix, sep, _ = prop_qname.partition(":")
+        if sep:
+            style = self._ns_styles.get(ns_prefix)
+            if style is not None:
+                return style
 
         # Check for property type styling
         # (e.g., different colors for ObjectProperty vs DatatypeProperty)
+        qname = self._graph_index(graph).qname
         for prop_type in graph.objects(prop, RDF.type):
-            # Get QName using graph's namespace manager
-            type_qname = graph.namespace_manager.normalizeUri(prop_type)
-            type_key = f"type:{type_qname}"
-            if type_key in self.class_styles:
-                return self.class_styles[type_key]
+            style = self._type_styles.get(qname(prop_type))
+            if style is not None:
+                return style
 
         # Default: gray for all properties
-        return ColorPalette({
-            "fill": "#CCCCCC",
-            "border": "#666666",
-            "text": "#000000"
-        })
+        return _DEFAULT_PROPERTY_STYLE
 
     def get_arrow_style(self, relationship_type: str) -> Optional[ArrowStyle]:
         """Get arrow style for a relationship type.
@@ -502,19 +789,15 @@ class StyleScheme:
         if not self.show_stereotypes:
             return None
 
+        # QName lookup, cached per graph
+        qname = self._graph_index(graph).qname
+
         # Handle instances with multiple types
         if is_instance:
             types = []
-            metaclass_types = {
-                "owl:Class", "rdfs:Class",
-                "owl:ObjectProperty", "owl:DatatypeProperty",
-                "owl:AnnotationProperty", "rdf:Property"
-            }
-
             for rdf_type in graph.objects(entity, RDF.type):
-                # Get QName using graph's namespace manager
-                type_qname = graph.namespace_manager.normalizeUri(rdf_type)
-                if type_qname not in metaclass_types:
+                type_qname = qname(rdf_type)
+                if type_qname not in _METACLASS_QNAMES:
                     types.append(type_qname)
 
             if types:
@@ -524,13 +807,10 @@ class StyleScheme:
 
         # Handle classes/properties (existing logic)
         for rdf_type in graph.objects(entity, RDF.type):
-            # Get QName using graph's namespace manager
-            type_qname = graph.namespace_manager.normalizeUri(rdf_type)
+            type_qname = qname(rdf_type)
             if type_qname in self.stereotype_map:
                 return self.stereotype_map[type_qname]
-            if type_qname in ("owl:Class", "rdfs:Class",
-                              "owl:ObjectProperty", "owl:DatatypeProperty",
-                              "owl:AnnotationProperty", "rdf:Property"):
+            if type_qname in _METACLASS_QNAMES:
                 return f"<<{type_qname}>>"
 
         return None
@@ -543,6 +823,74 @@ class StyleScheme:
         )
 
 
+@lru_cache(maxsize=32)
+def _parse_style_yaml(path: str, mtime_ns: int, size: int, use_sidecar: bool) -> Any:
+    """Parse a style YAML file, cached by resolved path, mtime and size.
+
+    The mtime and size are part of the cache key so that edits to the
+    file are picked up, and use_sidecar so that toggling STYLE_CACHE_ENV
+    takes effect for files already parsed.
+
+    Args:
+        path: Resolved path to the YAML file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        use_sidecar: Whether to go through the JSON sidecar cache
+
+    Returns:
+        Parsed YAML content
+    """
+    if use_sidecar:
+        return _parse_style_yaml_with_sidecar(Path(path), mtime_ns)
+    return _read_style_yaml(Path(path))
+
+
+def _read_style_yaml(path: Path) -> Any:
+    """Parse a style YAML file.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    # Stream the raw bytes; the parser decodes UTF-8 as it reads
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _parse_style_yaml_with_sidecar(path: Path, mtime_ns: int) -> Any:
+    """Parse a style YAML file through a "<name>.cache.json" sidecar.
+
+    The sidecar is used when it is at least as new as the YAML file, and
+    rewritten otherwise. Content that doesn't survive a JSON round trip
+    (e.g. dates or non-string keys) is never cached, and a sidecar that
+    can't be read or written is ignored.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: YAML file modification time in nanoseconds
+
+    Returns:
+        Parsed YAML content
+    """
+    sidecar = path.with_name(f"{path.name}.cache.json")
+    try:
+        if sidecar.stat().st_mtime_ns >= mtime_ns:
+            return json.loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    config = _read_style_yaml(path)
+    try:
+        text = json.dumps(config)
+        if json.loads(text) == config:
+            sidecar.write_text(text, encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        pass
+    return config
+
+
 class StyleConfig:
     """Configuration for PlantUML styling.
 
@@ -560,8 +908,15 @@ class StyleConfig:
         Args:
             yaml_path: Path to YAML style configuration file
         """
-        yaml_path = Path(yaml_path)
-        self.config = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+        yaml_path = Path(yaml_path).resolve()
+        stat = yaml_path.stat()
+        # The JSON sidecar cache is opt-in via STYLE_CACHE_ENV="1"
+        use_sidecar = os.environ.get(STYLE_CACHE_ENV) == "1"
+        parsed = _parse_style_yaml(
+            str(yaml_path), stat.st_mtime_ns, stat.st_size, use_sidecar
+        )
+        # Copy so callers can't mutate the cached parse result
+        self.config = copy.deepcopy(parsed)
 
         self.defaults = self.config.get("defaults", {}) or {}
 
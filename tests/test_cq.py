@@ -1,10 +1,17 @@
 """Unit tests for the competency question testing module."""
 
+import json
+import re
+import xml.etree.ElementTree as ET
+
 import pytest
 from pathlib import Path
 from io import StringIO
+from types import MappingProxyType
 
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal
+from rdflib.plugins.stores.memory import Memory
+from rdflib.query import Result
 
 from rdf_construct.cq.expectations import (
     BooleanExpectation,
@@ -24,6 +31,7 @@ from rdf_construct.cq.loader import (
 from rdf_construct.cq.runner import (
     CQTestRunner,
     CQStatus,
+    _prepare_query,
 )
 from rdf_construct.cq.formatters import format_text, format_json, format_junit
 
@@ -31,10 +39,17 @@ from rdf_construct.cq.formatters import format_text, format_json, format_junit
 # Test fixtures
 EX = Namespace("http://example.org/test#")
 
+# Status, test ID and summary of a single passing test, in report order
+PASSING_TEXT = re.compile(r"(?s)PASS.*test-001.*1 passed")
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_graph():
-    """Create a simple test graph."""
+    """Create a simple test graph, shared by the session.
+
+    Tests only query this graph; build a separate graph for any test that
+    needs to modify one.
+    """
     g = Graph()
     g.bind("ex", EX)
     g.bind("owl", OWL)
@@ -57,14 +72,75 @@ def simple_graph():
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prefixes():
-    """Standard prefixes for tests."""
-    return {
+    """Standard prefixes for tests (read-only, shared by the session)."""
+    return MappingProxyType({
         "ex": "http://example.org/test#",
         "owl": "http://www.w3.org/2002/07/owl#",
         "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-    }
+    })
+
+
+@pytest.fixture(scope="session")
+def dog_result(simple_graph):
+    """Rows of a SELECT for all dogs, materialised once for reuse."""
+    return list(simple_graph.query(
+        "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
+    ))
+
+
+@pytest.fixture(scope="session")
+def empty_result(simple_graph):
+    """Rows of a SELECT that matches nothing, materialised once for reuse."""
+    return list(simple_graph.query(
+        "SELECT ?x WHERE { ?x a <http://example.org/test#NonExistent> }"
+    ))
+
+
+@pytest.fixture(scope="session")
+def ask_true_result(simple_graph):
+    """Result of an ASK that matches, queried once for reuse."""
+    return simple_graph.query("ASK { ?x a <http://www.w3.org/2002/07/owl#Class> }")
+
+
+@pytest.fixture(scope="session")
+def ask_false_result(simple_graph):
+    """Result of an ASK that matches nothing, queried once for reuse."""
+    return simple_graph.query("ASK { ?x a <http://example.org/test#NonExistent> }")
+
+
+@pytest.fixture(scope="session")
+def animal_pass_results(simple_graph, prefixes):
+    """Results of running a single passing ASK test, shared by the session."""
+    test = CQTest(
+        id="test-001",
+        name="Animal class exists",
+        query="ASK { ex:Animal a owl:Class }",
+        expectation=BooleanExpectation(True),
+    )
+    suite = CQTestSuite(prefixes=prefixes, questions=[test])
+    return CQTestRunner().run(simple_graph, suite)
+
+
+@pytest.fixture(scope="session")
+def animal_fail_results(simple_graph, prefixes):
+    """Results of running a single failing ASK test, shared by the session."""
+    test = CQTest(
+        id="test-002",
+        name="NonExistent class exists",
+        query="ASK { ex:NonExistent a owl:Class }",
+        expectation=BooleanExpectation(True),
+    )
+    suite = CQTestSuite(prefixes=prefixes, questions=[test])
+    return CQTestRunner().run(simple_graph, suite)
+
+
+@pytest.fixture(scope="session")
+def animal_pass_junit(animal_pass_results):
+    """Parsed JUnit XML for the passing results, shared by the session."""
+    # Parsing also checks that the output is valid XML
+    return ET.fromstring(format_junit(animal_pass_results))
 
 
 # ============================================
@@ -74,68 +150,61 @@ def prefixes():
 class TestBooleanExpectation:
     """Tests for ASK query expectations."""
 
-    def test_true_matches_true(self, simple_graph):
-        """ASK query returning true should match expect: true."""
-        result = simple_graph.query("ASK { ?x a <http://www.w3.org/2002/07/owl#Class> }")
-        exp = BooleanExpectation(True)
-        check = exp.check(result)
-        assert check.passed
-
-    def test_true_fails_false(self, simple_graph):
-        """ASK query returning true should fail expect: false."""
-        result = simple_graph.query("ASK { ?x a <http://www.w3.org/2002/07/owl#Class> }")
-        exp = BooleanExpectation(False)
-        check = exp.check(result)
-        assert not check.passed
-
-    def test_false_matches_false(self, simple_graph):
-        """ASK query returning false should match expect: false."""
-        result = simple_graph.query("ASK { ?x a <http://example.org/test#NonExistent> }")
-        exp = BooleanExpectation(False)
-        check = exp.check(result)
-        assert check.passed
+    @pytest.mark.parametrize("result_fixture, expected, should_pass", [
+        ("ask_true_result", True, True),
+        ("ask_true_result", False, False),
+        ("ask_false_result", False, True),
+    ])
+    def test_boolean(self, request, result_fixture, expected, should_pass):
+        """ASK results should pass only when they equal the expected value."""
+        result = request.getfixturevalue(result_fixture)
+        check = BooleanExpectation(expected).check(result)
+        assert check.passed is should_pass
 
 
 class TestHasResultsExpectation:
     """Tests for has_results expectation."""
 
-    def test_has_results_passes(self, simple_graph):
+    def test_has_results_passes(self, dog_result):
         """Query with results should pass has_results."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
+        result = dog_result
         exp = HasResultsExpectation()
         check = exp.check(result)
         assert check.passed
         assert "2" in check.actual  # Two dogs
 
-    def test_has_results_fails_empty(self, simple_graph):
+    def test_has_results_fails_empty(self, empty_result):
         """Query with no results should fail has_results."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#NonExistent> }"
-        )
+        result = empty_result
         exp = HasResultsExpectation()
         check = exp.check(result)
         assert not check.passed
 
+    def test_lazy_result_stops_at_first_row(self, dog_result):
+        """Should read only the first row of a result that is not materialised."""
+        def rows():
+            yield dog_result[0]
+            raise AssertionError("read past the first row")
+
+        check = HasResultsExpectation().check(rows())
+
+        assert check.passed
+        assert check.actual == "≥1 results"
+
 
 class TestNoResultsExpectation:
     """Tests for no_results expectation."""
 
-    def test_no_results_passes(self, simple_graph):
+    def test_no_results_passes(self, empty_result):
         """Empty query should pass no_results."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#NonExistent> }"
-        )
+        result = empty_result
         exp = NoResultsExpectation()
         check = exp.check(result)
         assert check.passed
 
-    def test_no_results_fails(self, simple_graph):
+    def test_no_results_fails(self, dog_result):
         """Query with results should fail no_results."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
+        result = dog_result
         exp = NoResultsExpectation()
         check = exp.check(result)
         assert not check.passed
@@ -144,133 +213,73 @@ class TestNoResultsExpectation:
 class TestCountExpectation:
     """Tests for count expectations."""
 
-    def test_exact_count_passes(self, simple_graph):
-        """Exact count should pass when matched."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(exact=2)
-        check = exp.check(result)
-        assert check.passed
-
-    def test_exact_count_fails(self, simple_graph):
-        """Exact count should fail when not matched."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(exact=3)
-        check = exp.check(result)
-        assert not check.passed
-
-    def test_min_count_passes(self, simple_graph):
-        """Min count should pass when >= min."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(min_count=1)
-        check = exp.check(result)
-        assert check.passed
-
-    def test_min_count_fails(self, simple_graph):
-        """Min count should fail when < min."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(min_count=5)
-        check = exp.check(result)
-        assert not check.passed
-
-    def test_max_count_passes(self, simple_graph):
-        """Max count should pass when <= max."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(max_count=5)
-        check = exp.check(result)
-        assert check.passed
-
-    def test_range_count(self, simple_graph):
-        """Range count should work with both min and max."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
-        exp = CountExpectation(min_count=1, max_count=5)
-        check = exp.check(result)
-        assert check.passed
+    @pytest.mark.parametrize("kwargs, should_pass", [
+        (dict(exact=2), True),
+        (dict(exact=3), False),
+        (dict(min_count=1), True),
+        (dict(min_count=5), False),
+        (dict(max_count=5), True),
+        (dict(min_count=1, max_count=5), True),
+    ])
+    def test_count(self, dog_result, kwargs, should_pass):
+        """Count bounds should pass only when the two dogs are within them."""
+        check = CountExpectation(**kwargs).check(dog_result)
+        assert check.passed is should_pass
 
 
 class TestContainsExpectation:
     """Tests for contains expectation (subset matching)."""
 
-    def test_contains_single_binding(self, simple_graph):
+    def test_contains_single_binding(self, dog_result):
         """Should find a single expected binding."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
+        result = dog_result
         exp = ContainsExpectation(expected_bindings=[
             {"x": "http://example.org/test#Fido"}
         ])
         check = exp.check(result)
         assert check.passed
 
-    def test_contains_missing_binding(self, simple_graph):
+    def test_contains_missing_binding(self, dog_result):
         """Should fail when expected binding is missing."""
-        result = simple_graph.query(
-            "SELECT ?x WHERE { ?x a <http://example.org/test#Dog> }"
-        )
+        result = dog_result
         exp = ContainsExpectation(expected_bindings=[
             {"x": "http://example.org/test#NonExistent"}
         ])
         check = exp.check(result)
         assert not check.passed
 
+    @pytest.mark.parametrize("binding, should_pass", [
+        ({"x": "a"}, True),
+        ({"x": "a", "y": "b"}, True),
+        ({"x": "a", "y": "c"}, False),
+        ({"z": "a"}, False),
+    ])
+    def test_contains_partial_binding(self, binding, should_pass):
+        """Should match bindings that give only some of a row's variables."""
+        rows = [{"x": "a", "y": "b"}, {"x": "c", "y": "d"}]
+        check = ContainsExpectation(expected_bindings=[binding]).check(rows)
+        assert check.passed is should_pass
+
 
 class TestParseExpectation:
     """Tests for expectation parsing from YAML values."""
 
-    def test_parse_boolean_true(self):
-        """Should parse boolean True."""
-        exp = parse_expectation(True)
-        assert isinstance(exp, BooleanExpectation)
-        assert exp.expected is True
-
-    def test_parse_boolean_false(self):
-        """Should parse boolean False."""
-        exp = parse_expectation(False)
-        assert isinstance(exp, BooleanExpectation)
-        assert exp.expected is False
-
-    def test_parse_has_results_string(self):
-        """Should parse 'has_results' string."""
-        exp = parse_expectation("has_results")
-        assert isinstance(exp, HasResultsExpectation)
-
-    def test_parse_no_results_string(self):
-        """Should parse 'no_results' string."""
-        exp = parse_expectation("no_results")
-        assert isinstance(exp, NoResultsExpectation)
-
-    def test_parse_count_dict(self):
-        """Should parse count dict."""
-        exp = parse_expectation({"count": 5})
-        assert isinstance(exp, CountExpectation)
-        assert exp.exact == 5
-
-    def test_parse_min_results_dict(self):
-        """Should parse min_results dict."""
-        exp = parse_expectation({"min_results": 1})
-        assert isinstance(exp, CountExpectation)
-        assert exp.min_count == 1
-
-    def test_parse_results_dict(self):
-        """Should parse results dict."""
-        exp = parse_expectation({"results": [{"x": "value"}]})
-        assert isinstance(exp, ValuesExpectation)
-
-    def test_parse_contains_dict(self):
-        """Should parse contains dict."""
-        exp = parse_expectation({"contains": [{"x": "value"}]})
-        assert isinstance(exp, ContainsExpectation)
+    @pytest.mark.parametrize("value, cls, attr, expected", [
+        (True, BooleanExpectation, "expected", True),
+        (False, BooleanExpectation, "expected", False),
+        ("has_results", HasResultsExpectation, None, None),
+        ("no_results", NoResultsExpectation, None, None),
+        ({"count": 5}, CountExpectation, "exact", 5),
+        ({"min_results": 1}, CountExpectation, "min_count", 1),
+        ({"results": [{"x": "value"}]}, ValuesExpectation, None, None),
+        ({"contains": [{"x": "value"}]}, ContainsExpectation, None, None),
+    ])
+    def test_parse(self, value, cls, attr, expected):
+        """Should parse each supported YAML form into its expectation."""
+        exp = parse_expectation(value)
+        assert type(exp) is cls
+        if attr:
+            assert getattr(exp, attr) == expected
 
     def test_parse_unknown_raises(self):
         """Should raise for unknown format."""
@@ -301,6 +310,46 @@ class TestBuildQueryWithPrefixes:
         # Should only have one PREFIX ex: declaration
         assert result.count("PREFIX ex:") == 1
 
+    def test_finds_declarations_with_any_spacing(self):
+        """Should recognise declarations however they are spaced or cased."""
+        query = "prefix  ex:<http://example.org/test#>\nSELECT ?x WHERE { ?x a ex:Dog }"
+        prefixes = {
+            "ex": "http://example.org/test#",
+            "owl": "http://www.w3.org/2002/07/owl#",
+        }
+        result = build_query_with_prefixes(query, prefixes)
+        assert result == "PREFIX owl: <http://www.w3.org/2002/07/owl#>\n\n" + query
+
+    def test_suite_expands_queries_on_construction(self, tagged_suite, prefixes):
+        """Should expand each distinct query once when the suite is built."""
+        assert tagged_suite.expanded_queries == {
+            "ASK {}": build_query_with_prefixes("ASK {}", prefixes),
+        }
+
+
+class TestLoadTestSuite:
+    """Tests for loading test suites from YAML."""
+
+    @pytest.mark.parametrize("content, message", [
+        ("", "Empty test suite file"),
+        ("prefixes: [ex]\n", "'prefixes' must be a dictionary"),
+        ("questions: {}\n", "'questions' must be a list"),
+        (
+            "questions:\n  - id: cq1\n    expect: true\n",
+            "missing required 'query' field",
+        ),
+        (
+            "questions:\n  - id: cq1\n    query: 42\n    expect: true\n",
+            "'query' field must be a string",
+        ),
+    ])
+    def test_malformed_suite_raises(self, tmp_path, content, message):
+        """Should reject malformed suites with a ValueError."""
+        path = tmp_path / "cq.yml"
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError, match=message):
+            load_test_suite(path)
+
 
 # ============================================
 # Runner Tests
@@ -309,40 +358,30 @@ class TestBuildQueryWithPrefixes:
 class TestCQTestRunner:
     """Tests for the test runner."""
 
-    def test_run_passing_ask_test(self, simple_graph, prefixes):
+    def test_run_passing_ask_test(self, animal_pass_results):
         """Should correctly run a passing ASK test."""
-        test = CQTest(
-            id="test-001",
-            name="Animal class exists",
-            query="ASK { ex:Animal a owl:Class }",
-            expectation=BooleanExpectation(True),
-        )
-        suite = CQTestSuite(prefixes=prefixes, questions=[test])
-
-        runner = CQTestRunner()
-        results = runner.run(simple_graph, suite)
+        results = animal_pass_results
 
         assert results.total_count == 1
         assert results.passed_count == 1
         assert results.all_passed
 
-    def test_run_failing_test(self, simple_graph, prefixes):
+    def test_run_failing_test(self, animal_fail_results):
         """Should correctly run a failing test."""
-        test = CQTest(
-            id="test-002",
-            name="NonExistent class exists",
-            query="ASK { ex:NonExistent a owl:Class }",
-            expectation=BooleanExpectation(True),
-        )
-        suite = CQTestSuite(prefixes=prefixes, questions=[test])
-
-        runner = CQTestRunner()
-        results = runner.run(simple_graph, suite)
+        results = animal_fail_results
 
         assert results.total_count == 1
         assert results.failed_count == 1
         assert not results.all_passed
 
+    def test_status_counts_computed_once(self, animal_fail_results):
+        """Should count statuses once and reuse the counts."""
+        counts = animal_fail_results.status_counts
+
+        assert animal_fail_results.status_counts is counts
+        assert counts[CQStatus.FAIL] == 1
+        assert counts[CQStatus.PASS] == 0
+
     def test_run_skipped_test(self, simple_graph, prefixes):
         """Should correctly handle skipped tests."""
         test = CQTest(
@@ -378,6 +417,65 @@ class TestCQTestRunner:
         assert results.total_count == 1
         assert results.error_count == 1
 
+    def test_repeated_queries_reuse_prepared_form(self, simple_graph, prefixes):
+        """Should parse a repeated query only once."""
+        test = CQTest(
+            id="test-005",
+            name="Cat class exists",
+            query="ASK { ex:Cat a owl:Class }",
+            expectation=BooleanExpectation(True),
+        )
+        suite = CQTestSuite(prefixes=prefixes, questions=[test, test])
+        _prepare_query.cache_clear()
+
+        results = CQTestRunner().run(simple_graph, suite)
+
+        assert results.passed_count == 2
+        assert _prepare_query.cache_info().misses == 1
+        assert _prepare_query.cache_info().hits == 1
+
+    def test_graph_prefixes_resolve_without_declaration(self, prefixes):
+        """Should resolve prefixes bound on the graph but not in the suite."""
+        g = Graph()
+        g.bind("zoo", "http://example.org/zoo#")
+        g.add((EX.Lion, RDF.type, OWL.Class))
+        g.add((EX.Lion, RDFS.seeAlso, Namespace("http://example.org/zoo#").Cat))
+        test = CQTest(
+            id="test-006",
+            name="Undeclared graph prefix",
+            query="ASK { ?c rdfs:seeAlso zoo:Cat }",
+            expectation=BooleanExpectation(True),
+        )
+        suite = CQTestSuite(prefixes=prefixes, questions=[test])
+
+        results = CQTestRunner().run(g, suite)
+
+        assert results.all_passed
+
+    def test_native_sparql_store_receives_query_text(self, prefixes):
+        """Should send query text, not a prepared query, to native SPARQL stores."""
+        received = []
+
+        class NativeStore(Memory):
+            def query(self, query, initNs, initBindings, queryGraph, **kwargs):
+                received.append(query)
+                result = Result("ASK")
+                result.askAnswer = True
+                return result
+
+        test = CQTest(
+            id="test-007",
+            name="Native store",
+            query="ASK { ex:Animal a owl:Class }",
+            expectation=BooleanExpectation(True),
+        )
+        suite = CQTestSuite(prefixes=prefixes, questions=[test])
+
+        results = CQTestRunner().run(Graph(store=NativeStore()), suite)
+
+        assert results.all_passed
+        assert received == [suite.expanded_query(test)]
+
     def test_fail_fast_stops_early(self, simple_graph, prefixes):
         """Should stop on first failure when fail_fast is True."""
         tests = [
@@ -410,45 +508,19 @@ class TestCQTestRunner:
 class TestTextFormatter:
     """Tests for text output formatting."""
 
-    def test_format_passing_results(self, simple_graph, prefixes):
+    def test_format_passing_results(self, animal_pass_results):
         """Should format passing results correctly."""
-        test = CQTest(
-            id="test-001",
-            name="Animal class exists",
-            query="ASK { ex:Animal a owl:Class }",
-            expectation=BooleanExpectation(True),
-        )
-        suite = CQTestSuite(prefixes=prefixes, questions=[test])
+        output = format_text(animal_pass_results, use_color=False)
 
-        runner = CQTestRunner()
-        results = runner.run(simple_graph, suite)
-
-        output = format_text(results, use_color=False)
-
-        assert "PASS" in output
-        assert "test-001" in output
-        assert "1 passed" in output
+        assert PASSING_TEXT.search(output)
 
 
 class TestJsonFormatter:
     """Tests for JSON output formatting."""
 
-    def test_format_json_structure(self, simple_graph, prefixes):
+    def test_format_json_structure(self, animal_pass_results):
         """Should produce valid JSON with expected structure."""
-        import json
-
-        test = CQTest(
-            id="test-001",
-            name="Animal class exists",
-            query="ASK { ex:Animal a owl:Class }",
-            expectation=BooleanExpectation(True),
-        )
-        suite = CQTestSuite(prefixes=prefixes, questions=[test])
-
-        runner = CQTestRunner()
-        results = runner.run(simple_graph, suite)
-
-        output = format_json(results)
+        output = format_json(animal_pass_results)
         data = json.loads(output)
 
         assert "questions" in data
@@ -460,63 +532,71 @@ class TestJsonFormatter:
 class TestJunitFormatter:
     """Tests for JUnit XML output formatting."""
 
-    def test_format_junit_structure(self, simple_graph, prefixes):
+    def test_format_junit_structure(self, animal_pass_junit):
         """Should produce valid JUnit XML."""
-        import xml.etree.ElementTree as ET
-
-        test = CQTest(
-            id="test-001",
-            name="Animal class exists",
-            query="ASK { ex:Animal a owl:Class }",
-            expectation=BooleanExpectation(True),
-        )
-        suite = CQTestSuite(prefixes=prefixes, questions=[test])
+        assert animal_pass_junit.tag == "testsuite"
+        assert animal_pass_junit.get("tests") == "1"
+        assert animal_pass_junit.get("failures") == "0"
 
-        runner = CQTestRunner()
-        results = runner.run(simple_graph, suite)
-
-        output = format_junit(results)
+    def test_format_junit_testcase(self, animal_pass_junit):
+        """Should emit one testcase per question, named by id and name."""
+        testcases = animal_pass_junit.findall("testcase")
 
-        # Should be valid XML
-        root = ET.fromstring(output)
-        assert root.tag == "testsuite"
-        assert root.get("tests") == "1"
-        assert root.get("failures") == "0"
+        assert len(testcases) == 1
+        assert testcases[0].get("name") == "test-001: Animal class exists"
+        assert testcases[0].get("classname") == "CompetencyQuestions"
+        assert testcases[0].find("failure") is None
 
 
 # ============================================
 # Tag Filtering Tests
 # ============================================
 
+@pytest.fixture(scope="class")
+def tagged_suite(prefixes):
+    """Suite with one "core" and one "slow" test, shared by the class.
+
+    filter_by_tags() returns a new suite, so sharing is safe.
+    """
+    return CQTestSuite(prefixes=prefixes, questions=[
+        CQTest(id="t1", name="Test 1", query="ASK {}",
+               expectation=BooleanExpectation(True), tags=["core"]),
+        CQTest(id="t2", name="Test 2", query="ASK {}",
+               expectation=BooleanExpectation(True), tags=["slow"]),
+    ])
+
+
 class TestTagFiltering:
     """Tests for tag-based test filtering."""
 
-    def test_filter_include_tags(self, prefixes):
+    def test_filter_include_tags(self, tagged_suite):
         """Should include only tests with specified tags."""
-        tests = [
-            CQTest(id="t1", name="Test 1", query="ASK {}",
-                   expectation=BooleanExpectation(True), tags=["core"]),
-            CQTest(id="t2", name="Test 2", query="ASK {}",
-                   expectation=BooleanExpectation(True), tags=["extra"]),
-        ]
-        suite = CQTestSuite(prefixes=prefixes, questions=tests)
-
-        filtered = suite.filter_by_tags(include_tags={"core"})
+        filtered = tagged_suite.filter_by_tags(include_tags={"core"})
 
         assert len(filtered.questions) == 1
         assert filtered.questions[0].id == "t1"
 
-    def test_filter_exclude_tags(self, prefixes):
+    def test_filter_exclude_tags(self, tagged_suite):
         """Should exclude tests with specified tags."""
-        tests = [
-            CQTest(id="t1", name="Test 1", query="ASK {}",
-                   expectation=BooleanExpectation(True), tags=["core"]),
-            CQTest(id="t2", name="Test 2", query="ASK {}",
-                   expectation=BooleanExpectation(True), tags=["slow"]),
-        ]
-        suite = CQTestSuite(prefixes=prefixes, questions=tests)
-
-        filtered = suite.filter_by_tags(exclude_tags={"slow"})
+        filtered = tagged_suite.filter_by_tags(exclude_tags={"slow"})
 
         assert len(filtered.questions) == 1
         assert filtered.questions[0].id == "t1"
+        assert len(tagged_suite.questions) == 2
+
+    def test_identical_queries_share_one_string(self):
+        """Should intern query text so identical queries are one object."""
+        first, second = (
+            CQTest(id=f"t{i}", name=f"Test {i}", query="".join(["ASK ", "{}"]),
+                   expectation=BooleanExpectation(True))
+            for i in range(2)
+        )
+
+        assert first.query is second.query
+
+    def test_tag_set_matches_tags(self, tagged_suite):
+        """Should keep tags in order and expose them as a frozenset."""
+        question = tagged_suite.questions[0]
+
+        assert question.tags == ["core"]
+        assert question.tag_set == frozenset({"core"})
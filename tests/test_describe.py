@@ -1,6 +1,7 @@
 """Unit tests for the ontology describe module."""
 
 import json
+import re
 from pathlib import Path
 from textwrap import dedent
 
@@ -9,6 +10,7 @@ from click.testing import CliRunner
 from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef
 from rdflib.namespace import OWL, XSD
 
+from rdf_construct.cli import cli
 from rdf_construct.describe import (
     describe_file,
     describe_ontology,
@@ -36,10 +38,55 @@ from rdf_construct.describe import (
 )
 
 
+# Keep the module on one xdist worker so its shared fixtures are built once
+pytestmark = pytest.mark.xdist_group("describe")
+
 # Test namespaces
 EX = Namespace("http://example.org/")
 DCTERMS = Namespace("http://purl.org/dc/terms/")
 
+# Number of classes in the ontology written by large_ontology_file
+LARGE_ONTOLOGY_CLASSES = 2000
+
+# Start of a JSON document on its own line, after any status messages
+JSON_START = re.compile(r"^\s*\{", re.MULTILINE)
+
+# Class count in the metrics section of the text and markdown formats
+TEXT_CLASS_COUNT = re.compile(r"^\s*Classes: (\d+)$", re.MULTILINE)
+MARKDOWN_CLASS_COUNT = re.compile(r"^\| Classes \| (\d+) \|$", re.MULTILINE)
+
+# Error raised by format_description for an unsupported format name
+UNKNOWN_FORMAT = re.compile("Unknown format")
+
+# Content of the ontology file written by simple_ontology_file
+SIMPLE_ONTOLOGY_TTL = dedent('''
+    @prefix ex: <http://example.org/> .
+    @prefix owl: <http://www.w3.org/2002/07/owl#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+    ex:Ontology a owl:Ontology ;
+        rdfs:label "Test Ontology" ;
+        owl:versionInfo "1.0" .
+
+    ex:Building a owl:Class ;
+        rdfs:label "Building"@en ;
+        rdfs:comment "A structure with walls and a roof." .
+
+    ex:House a owl:Class ;
+        rdfs:subClassOf ex:Building ;
+        rdfs:label "House"@en .
+
+    ex:hasAddress a owl:DatatypeProperty ;
+        rdfs:domain ex:Building ;
+        rdfs:label "has address" .
+''').strip()
+
+
+def _describe_from_ttl(content: str) -> OntologyDescription:
+    """Describe an ontology parsed from a Turtle string, without a file."""
+    graph = Graph().parse(data=content, format="turtle")
+    return describe_ontology(graph, source="<string>")
+
 
 # --- Fixtures ---
 
@@ -49,18 +96,20 @@ def temp_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
+# Graph fixtures are built once per session. The describe functions only read
+# the graphs; build a separate graph for any test that needs to modify one.
+
+@pytest.fixture(scope="session")
 def empty_graph() -> Graph:
     """An empty RDF graph."""
     return Graph()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_rdfs_graph() -> Graph:
     """A minimal RDFS graph with just classes."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("rdfs", RDFS)
 
     g.add((EX.Animal, RDF.type, RDFS.Class))
     g.add((EX.Animal, RDFS.label, Literal("Animal")))
@@ -71,13 +120,11 @@ def minimal_rdfs_graph() -> Graph:
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_owl_graph() -> Graph:
     """A simple OWL ontology with classes and properties."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("owl", OWL)
-    g.bind("rdfs", RDFS)
 
     # Ontology declaration
     g.add((EX.Ontology, RDF.type, OWL.Ontology))
@@ -117,13 +164,11 @@ def simple_owl_graph() -> Graph:
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def owl_dl_graph() -> Graph:
     """An OWL DL ontology with restrictions."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("owl", OWL)
-    g.bind("rdfs", RDFS)
 
     # Ontology
     g.add((EX.Ontology, RDF.type, OWL.Ontology))
@@ -151,13 +196,11 @@ def owl_dl_graph() -> Graph:
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def owl_full_graph() -> Graph:
     """An OWL Full ontology with metaclass patterns."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("owl", OWL)
-    g.bind("rdfs", RDFS)
 
     # Ontology
     g.add((EX.Ontology, RDF.type, OWL.Ontology))
@@ -177,12 +220,11 @@ def owl_full_graph() -> Graph:
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def graph_with_imports() -> Graph:
     """An ontology that imports other ontologies."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("owl", OWL)
 
     # Ontology with imports
     g.add((EX.Ontology, RDF.type, OWL.Ontology))
@@ -192,13 +234,11 @@ def graph_with_imports() -> Graph:
     return g
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def graph_with_individuals() -> Graph:
     """An ontology with named individuals."""
     g = Graph()
     g.bind("ex", EX)
-    g.bind("owl", OWL)
-    g.bind("rdfs", RDFS)
 
     # Ontology
     g.add((EX.Ontology, RDF.type, OWL.Ontology))
@@ -217,36 +257,65 @@ def graph_with_individuals() -> Graph:
     return g
 
 
-@pytest.fixture
-def simple_ontology_file(temp_dir) -> Path:
-    """Create a simple ontology file for testing."""
-    content = dedent('''
-        @prefix ex: <http://example.org/> .
-        @prefix owl: <http://www.w3.org/2002/07/owl#> .
-        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-
-        ex:Ontology a owl:Ontology ;
-            rdfs:label "Test Ontology" ;
-            owl:versionInfo "1.0" .
-
-        ex:Building a owl:Class ;
-            rdfs:label "Building"@en ;
-            rdfs:comment "A structure with walls and a roof." .
-
-        ex:House a owl:Class ;
-            rdfs:subClassOf ex:Building ;
-            rdfs:label "House"@en .
-
-        ex:hasAddress a owl:DatatypeProperty ;
-            rdfs:domain ex:Building ;
-            rdfs:label "has address" .
-    ''').strip()
-
-    path = temp_dir / "test_ontology.ttl"
-    path.write_text(content)
+@pytest.fixture(scope="session")
+def simple_ontology_file(tmp_path_factory) -> Path:
+    """Write the simple ontology file once for the session (read-only)."""
+    path = tmp_path_factory.mktemp("data") / "test_ontology.ttl"
+    path.write_text(SIMPLE_ONTOLOGY_TTL)
+    return path
+
+
+@pytest.fixture(scope="session")
+def large_ontology_file(tmp_path_factory) -> Path:
+    """Write a large ontology as N-Triples, which parses faster than Turtle."""
+    rdf_type = f"<{RDF.type}>"
+    rdfs_label = f"<{RDFS.label}>"
+    lines = [f"<{EX.Ontology}> {rdf_type} <{OWL.Ontology}> ."]
+
+    for i in range(LARGE_ONTOLOGY_CLASSES):
+        cls = f"<{EX}Class{i}>"
+        lines.append(f"{cls} {rdf_type} <{OWL.Class}> .")
+        lines.append(f'{cls} {rdfs_label} "Class {i}" .')
+
+    path = tmp_path_factory.mktemp("large") / "large.nt"
+    path.write_text("\n".join(lines))
     return path
 
 
+@pytest.fixture(scope="class")
+def sample_description(simple_owl_graph: Graph) -> OntologyDescription:
+    """Describe simple_owl_graph once for each class of formatter tests."""
+    return describe_ontology(simple_owl_graph, source="test.ttl")
+
+
+@pytest.fixture(scope="class")
+def sample_json(sample_description: OntologyDescription) -> dict:
+    """JSON output for sample_description, parsed once per class."""
+    # Parsing also checks that the output is valid JSON
+    return json.loads(format_description(sample_description, format_name="json"))
+
+
+@pytest.fixture(scope="class")
+def simple_file_description(simple_ontology_file: Path) -> OntologyDescription:
+    """Describe the simple ontology file once for each class that uses it."""
+    return describe_file(simple_ontology_file)
+
+
+@pytest.fixture(scope="class")
+def simple_file_outputs(simple_file_description: OntologyDescription) -> dict[str, str]:
+    """The simple ontology file's description in each format, formatted once."""
+    return {
+        format_name: format_description(simple_file_description, format_name=format_name)
+        for format_name in ("text", "json", "markdown")
+    }
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """A Click test runner; each invoke captures output separately."""
+    return CliRunner()
+
+
 # --- Profile Detection Tests ---
 
 class TestProfileDetection:
@@ -426,7 +495,7 @@ class TestNamespaceAnalysis:
         ns_info = analyse_namespaces(simple_owl_graph)
         assert len(ns_info.namespaces) > 0
         # Should detect the example namespace
-        ns_uris = [ns.uri for ns in ns_info.namespaces]
+        ns_uris = {ns.uri for ns in ns_info.namespaces}
         assert "http://example.org/" in ns_uris
 
     def test_namespace_categorisation(self, simple_owl_graph: Graph):
@@ -519,7 +588,7 @@ class TestDescribeAPI:
         """describe_file loads and describes ontology."""
         description = describe_file(simple_ontology_file)
         assert isinstance(description, OntologyDescription)
-        assert str(simple_ontology_file) in str(description.source)
+        assert Path(description.source) == simple_ontology_file
 
     def test_describe_file_not_found(self, temp_dir: Path):
         """describe_file raises for missing file."""
@@ -531,7 +600,7 @@ class TestDescribeAPI:
         bad_file = temp_dir / "bad.ttl"
         bad_file.write_text("this is not valid turtle")
 
-        with pytest.raises(Exception):  # Could be ValueError or rdflib exception
+        with pytest.raises(ValueError, match="Failed to parse"):
             describe_file(bad_file)
 
     def test_describe_brief_mode(self, simple_ontology_file: Path):
@@ -550,11 +619,6 @@ class TestDescribeAPI:
 class TestFormatters:
     """Tests for output formatters."""
 
-    @pytest.fixture
-    def sample_description(self, simple_owl_graph: Graph) -> OntologyDescription:
-        """Create a sample description for formatter tests."""
-        return describe_ontology(simple_owl_graph, source="test.ttl")
-
     def test_text_format_output(self, sample_description: OntologyDescription):
         """Text formatter produces readable output."""
         output = format_description(sample_description, format_name="text")
@@ -571,34 +635,27 @@ class TestFormatters:
         # ANSI escape codes start with \x1b[
         assert "\x1b[" not in output
 
-    def test_json_format_valid(self, sample_description: OntologyDescription):
+    def test_json_format_valid(self, sample_json: dict):
         """JSON formatter produces valid JSON."""
-        output = format_description(sample_description, format_name="json")
-        parsed = json.loads(output)
-        assert isinstance(parsed, dict)
+        assert isinstance(sample_json, dict)
 
-    def test_json_format_structure(self, sample_description: OntologyDescription):
+    def test_json_format_structure(self, sample_json: dict):
         """JSON output has expected structure."""
-        output = format_description(sample_description, format_name="json")
-        parsed = json.loads(output)
-
         # Should have main sections
-        assert "metrics" in parsed
-        assert "profile" in parsed
+        assert "metrics" in sample_json
+        assert "profile" in sample_json
 
-    def test_markdown_format_headers(self, sample_description: OntologyDescription):
-        """Markdown formatter includes headers."""
-        output = format_description(sample_description, format_name="markdown")
+    @pytest.mark.parametrize("format_name", ["markdown", "md"])
+    def test_markdown_format_headers(
+        self, sample_description: OntologyDescription, format_name: str
+    ):
+        """Markdown formatter, also selected as 'md', includes headers."""
+        output = format_description(sample_description, format_name=format_name)
         assert "#" in output  # Has markdown headers
 
-    def test_md_alias(self, sample_description: OntologyDescription):
-        """'md' is accepted as alias for markdown."""
-        output = format_description(sample_description, format_name="md")
-        assert "#" in output
-
     def test_invalid_format_raises(self, sample_description: OntologyDescription):
         """Invalid format name raises ValueError."""
-        with pytest.raises(ValueError, match="Unknown format"):
+        with pytest.raises(ValueError, match=UNKNOWN_FORMAT):
             format_description(sample_description, format_name="invalid")
 
 
@@ -607,22 +664,21 @@ class TestFormatters:
 class TestDescribeCLI:
     """Tests for the describe CLI command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a Click test runner."""
-        return CliRunner()
-
-    def test_cli_basic(self, runner: CliRunner, simple_ontology_file: Path):
-        """Basic CLI invocation works."""
-        from rdf_construct.cli import cli
-
-        result = runner.invoke(cli, ["describe", str(simple_ontology_file)])
+    @pytest.mark.parametrize("extra_args", [
+        [],
+        ["--format", "markdown"],
+        ["--brief"],
+        ["--no-resolve"],
+    ])
+    def test_cli_options(
+        self, runner: CliRunner, simple_ontology_file: Path, extra_args: list[str]
+    ):
+        """CLI invocation works with each option."""
+        result = runner.invoke(cli, ["describe", str(simple_ontology_file), *extra_args])
         assert result.exit_code == 0
 
     def test_cli_json_format(self, runner: CliRunner, simple_ontology_file: Path):
         """CLI JSON format produces valid JSON."""
-        from rdf_construct.cli import cli
-
         result = runner.invoke(
             cli,
             ["describe", str(simple_ontology_file), "--format", "json"],
@@ -630,45 +686,10 @@ class TestDescribeCLI:
         assert result.exit_code == 0
 
         # Find the JSON in output (may have status messages before it)
-        lines = result.output.strip().split("\n")
-        json_start = next(
-            (i for i, line in enumerate(lines) if line.strip().startswith("{")),
-            None,
-        )
-        if json_start is not None:
-            json_text = "\n".join(lines[json_start:])
-            parsed = json.loads(json_text)
-            assert isinstance(parsed, dict)
-
-    def test_cli_markdown_format(self, runner: CliRunner, simple_ontology_file: Path):
-        """CLI markdown format works."""
-        from rdf_construct.cli import cli
-
-        result = runner.invoke(
-            cli,
-            ["describe", str(simple_ontology_file), "--format", "markdown"],
-        )
-        assert result.exit_code == 0
-
-    def test_cli_brief_mode(self, runner: CliRunner, simple_ontology_file: Path):
-        """CLI brief mode works."""
-        from rdf_construct.cli import cli
-
-        result = runner.invoke(
-            cli,
-            ["describe", str(simple_ontology_file), "--brief"],
-        )
-        assert result.exit_code == 0
-
-    def test_cli_no_resolve(self, runner: CliRunner, simple_ontology_file: Path):
-        """CLI --no-resolve option works."""
-        from rdf_construct.cli import cli
-
-        result = runner.invoke(
-            cli,
-            ["describe", str(simple_ontology_file), "--no-resolve"],
-        )
-        assert result.exit_code == 0
+        json_start = JSON_START.search(result.output)
+        assert json_start is not None
+        parsed = json.loads(result.output[json_start.start():])
+        assert isinstance(parsed, dict)
 
     def test_cli_output_file(
         self,
@@ -677,8 +698,6 @@ class TestDescribeCLI:
         temp_dir: Path,
     ):
         """CLI can write to output file."""
-        from rdf_construct.cli import cli
-
         output_file = temp_dir / "description.txt"
         result = runner.invoke(
             cli,
@@ -690,15 +709,11 @@ class TestDescribeCLI:
 
     def test_cli_file_not_found(self, runner: CliRunner):
         """CLI exits with error for missing file."""
-        from rdf_construct.cli import cli
-
         result = runner.invoke(cli, ["describe", "/nonexistent/file.ttl"])
         assert result.exit_code == 2
 
     def test_cli_no_colour(self, runner: CliRunner, simple_ontology_file: Path):
         """CLI --no-colour option works."""
-        from rdf_construct.cli import cli
-
         result = runner.invoke(
             cli,
             ["describe", str(simple_ontology_file), "--no-colour"],
@@ -713,42 +728,36 @@ class TestDescribeCLI:
 class TestDescribeIntegration:
     """Integration tests for complete describe workflows."""
 
-    def test_roundtrip_file_to_json(self, simple_ontology_file: Path):
+    def test_roundtrip_file_to_json(self, simple_file_outputs: dict[str, str]):
         """Full workflow: file -> describe -> JSON -> parse."""
-        description = describe_file(simple_ontology_file)
-        json_output = format_description(description, format_name="json")
-        parsed = json.loads(json_output)
+        parsed = json.loads(simple_file_outputs["json"])
 
         # Verify key data survived roundtrip
         assert parsed["metrics"]["classes"] == 2  # Building, House
 
-    def test_multiple_formats_consistent(self, simple_ontology_file: Path):
+    def test_multiple_formats_consistent(self, simple_file_outputs: dict[str, str]):
         """All formats report consistent metrics."""
-        description = describe_file(simple_ontology_file)
-
-        text_output = format_description(description, format_name="text")
-        json_output = format_description(description, format_name="json")
-        md_output = format_description(description, format_name="markdown")
-
         # All should mention the same class count
-        parsed_json = json.loads(json_output)
+        parsed_json = json.loads(simple_file_outputs["json"])
         class_count = parsed_json["metrics"]["classes"]
 
-        assert str(class_count) in text_output
-        assert str(class_count) in md_output
+        text_count = TEXT_CLASS_COUNT.search(simple_file_outputs["text"])
+        md_count = MARKDOWN_CLASS_COUNT.search(simple_file_outputs["markdown"])
+        assert text_count and int(text_count.group(1)) == class_count
+        assert md_count and int(md_count.group(1)) == class_count
 
-    def test_description_to_dict(self, simple_ontology_file: Path):
+    def test_description_to_dict(self, simple_file_description: OntologyDescription):
         """OntologyDescription can be converted to dict."""
-        description = describe_file(simple_ontology_file)
+        description = simple_file_description
         d = description.to_dict()
 
         assert "source" in d
         assert "metrics" in d
         assert "profile" in d
 
-    def test_verdict_generation(self, simple_ontology_file: Path):
+    def test_verdict_generation(self, simple_file_description: OntologyDescription):
         """Description includes verdict summary."""
-        description = describe_file(simple_ontology_file)
+        description = simple_file_description
         assert description.verdict is not None
         assert len(description.verdict) > 0
 
@@ -758,7 +767,7 @@ class TestDescribeIntegration:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_graph_with_blank_nodes(self, temp_dir: Path):
+    def test_graph_with_blank_nodes(self):
         """Handles graphs with blank nodes gracefully."""
         content = dedent('''
             @prefix ex: <http://example.org/> .
@@ -772,15 +781,12 @@ class TestEdgeCases:
                 ] .
         ''').strip()
 
-        path = temp_dir / "blank_nodes.ttl"
-        path.write_text(content)
-
         # Should not raise
-        description = describe_file(path)
+        description = _describe_from_ttl(content)
         assert description.metrics is not None
 
     def test_graph_with_unicode(self, temp_dir: Path):
-        """Handles unicode in labels."""
+        """Handles unicode in labels read from a UTF-8 file."""
         content = dedent('''
             @prefix ex: <http://example.org/> .
             @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
@@ -800,33 +806,23 @@ class TestEdgeCases:
         description = describe_file(path)
         assert description.metrics.classes == 2
 
-    def test_very_large_ontology_performance(self, temp_dir: Path):
-        """Handles larger ontologies without excessive time."""
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("large")
+    def test_very_large_ontology_performance(self, large_ontology_file: Path, record_property):
+        """Describes a large ontology completely.
+
+        The elapsed time is recorded for JUnit reports but not asserted,
+        since wall-clock limits flake on loaded CI runners.
+        """
         import time
 
-        # Generate a moderately large ontology
-        lines = [
-            "@prefix ex: <http://example.org/> .",
-            "@prefix owl: <http://www.w3.org/2002/07/owl#> .",
-            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
-            "",
-            "ex:Ontology a owl:Ontology .",
-        ]
-
-        # Add 500 classes
-        for i in range(500):
-            lines.append(f"ex:Class{i} a owl:Class ; rdfs:label \"Class {i}\" .")
-
-        path = temp_dir / "large.ttl"
-        path.write_text("\n".join(lines))
-
-        start = time.time()
-        description = describe_file(path, brief=True)
-        elapsed = time.time() - start
-
-        assert description.metrics.classes == 500
-        # Should complete in reasonable time (< 10 seconds)
-        assert elapsed < 10.0
+        start = time.perf_counter_ns()
+        description = describe_file(large_ontology_file, brief=True)
+        record_property("elapsed_ns", time.perf_counter_ns() - start)
+
+        assert description.metrics.classes == LARGE_ONTOLOGY_CLASSES
+        # Each class has a type and a label, plus the ontology declaration
+        assert description.metrics.total_triples == 2 * LARGE_ONTOLOGY_CLASSES + 1
 
 
 # --- Model Tests ---
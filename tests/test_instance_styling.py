@@ -3,9 +3,14 @@
 Run with: pytest test_instance_styling.py -v
 """
 
+import gc
+import sys
+
 import pytest
 from rdflib import Graph, Namespace, URIRef, RDF, RDFS
 
+from rdf_construct.uml.uml_style import StyleScheme
+
 
 @pytest.fixture
 def sample_graph():
@@ -70,8 +75,145 @@ def test_style_config_structure():
     assert "default" in config["instances"]
 
 
-# More tests would require the actual StyleScheme implementation
-# These are structural tests to verify the design
+@pytest.fixture
+def scheme():
+    """Create a style scheme with IES type styles."""
+    return StyleScheme("test", {
+        "classes": {
+            "by_type": {
+                "ies:Entity": {"border": "#FEFE54", "fill": "#FEFE54"},
+                "ies:State": {"border": "#F2F2F2", "fill": "#F2F2F2"},
+            },
+            "default": {"border": "#000000", "fill": "#FFFFFF"},
+        },
+    })
+
+
+def test_class_inherits_style_from_ancestor(sample_graph, scheme):
+    """Test that classes pick up the style of their nearest styled ancestor."""
+    BUILDING = Namespace("http://example.org/building#")
+
+    assert scheme.get_class_style(sample_graph, BUILDING.Wall).fill == "#FEFE54"
+    assert scheme.get_class_style(sample_graph, BUILDING.WallState).fill == "#F2F2F2"
+
+
+def test_inherited_style_follows_first_declared_branch():
+    """Test that the first superclass branch is searched before later ones."""
+    EX = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Child, RDFS.subClassOf, EX.Middle))
+    g.add((EX.Middle, RDFS.subClassOf, EX.Top))
+    scheme = StyleScheme("test", {
+        "classes": {"by_type": {"ex:Top": {"fill": "#111111"}}},
+    })
+
+    assert scheme.get_class_style(g, EX.Child).fill == "#111111"
+    assert scheme._get_ancestors(g, EX.Child) == [EX.Middle, EX.Top]
+
+
+def test_inherited_style_survives_cycles():
+    """Test that circular subClassOf chains terminate."""
+    EX = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.A, RDFS.subClassOf, EX.B))
+    g.add((EX.B, RDFS.subClassOf, EX.A))
+    scheme = StyleScheme("test", {"classes": {}})
+
+    assert scheme.get_class_style(g, EX.A) is None
+
+
+def test_inherited_style_handles_deep_hierarchies():
+    """Test that hierarchies deeper than the recursion limit still resolve."""
+    EX = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", EX)
+    depth = sys.getrecursionlimit() + 100
+    for i in range(depth):
+        g.add((EX[f"C{i}"], RDFS.subClassOf, EX[f"C{i + 1}"]))
+    scheme = StyleScheme("test", {
+        "classes": {"by_type": {f"ex:C{depth}": {"fill": "#222222"}}},
+    })
+
+    assert scheme.get_class_style(g, EX.C0).fill == "#222222"
+    assert len(scheme._get_ancestors(g, EX.C0)) == depth
+
+
+def test_class_style_lookups_are_cached(sample_graph, scheme):
+    """Test that repeated lookups reuse the resolved palette, including None."""
+    BUILDING = Namespace("http://example.org/building#")
+    unstyled = StyleScheme("bare", {})
+
+    first = scheme.get_class_style(sample_graph, BUILDING.Wall)
+
+    assert scheme.get_class_style(sample_graph, BUILDING.Wall) is first
+    assert unstyled.get_class_style(sample_graph, BUILDING.Wall) is None
+    assert unstyled._graph_index(sample_graph).styles == {(BUILDING.Wall, False): None}
+
+
+def test_graph_index_dropped_with_graph(scheme):
+    """Test that a graph's lookup index is released once the graph is collected."""
+    BUILDING = Namespace("http://example.org/building#")
+    graph = Graph()
+    graph.add((BUILDING.Wall, RDF.type, RDFS.Class))
+    scheme.get_class_style(graph, BUILDING.Wall)
+    assert id(graph) in scheme._graph_indexes
+
+    del graph
+    gc.collect()
+
+    assert scheme._graph_indexes == {}
+
+
+def test_class_styles_keeps_prefixed_keys():
+    """Test the combined class_styles view over the separate style indexes."""
+    scheme = StyleScheme("test", {
+        "classes": {
+            "by_namespace": {"ex": {"fill": "#111111"}},
+            "by_type": {"ex:Thing": {"fill": "#222222"}},
+            "default": {"fill": "#333333"},
+        },
+    })
+
+    assert {k: p.fill for k, p in scheme.class_styles.items()} == {
+        "ns:ex": "#111111",
+        "type:ex:Thing": "#222222",
+        "default": "#333333",
+    }
+    with pytest.raises(TypeError):
+        scheme.class_styles["type:ex:Other"] = scheme.class_styles["default"]
+
+
+def test_get_stereotype_skips_metaclasses():
+    """Test stereotype labels for classes and multi-typed instances."""
+    EX = Namespace("http://example.org/")
+    OWL = Namespace("http://www.w3.org/2002/07/owl#")
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Dog, RDF.type, OWL.Class))
+    g.add((EX.Rex, RDF.type, EX.Dog))
+    g.add((EX.Rex, RDF.type, EX.Pet))
+    g.add((EX.Rex, RDF.type, OWL.Class))
+    scheme = StyleScheme("test", {"show_stereotypes": True})
+
+    assert scheme.get_stereotype(g, EX.Dog) == "<<owl:Class>>"
+    assert scheme.get_stereotype(g, EX.Rex, is_instance=True) == "<<ex:Dog, ex:Pet>>"
+    assert StyleScheme("off", {}).get_stereotype(g, EX.Dog) is None
+
+
+def test_instance_styles_built_on_first_use():
+    """Test lazy instance palettes, including the legacy flat config."""
+    scheme = StyleScheme("test", {
+        "instances": {"by_type": {"ies:Entity": {"fill": "#000000"}}},
+    })
+    legacy = StyleScheme("legacy", {"instances": {"border": "#FEFE54"}})
+
+    assert scheme._instance_styles is None
+    assert list(scheme.instance_styles) == ["type:ies:Entity"]
+    assert scheme.instance_style_default is None
+    assert legacy.instance_style_default.border == "#FEFE54"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
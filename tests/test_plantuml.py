@@ -1,5 +1,9 @@
+import os
+
 import pytest
-from rdf_construct.uml.uml_style import ColorPalette
+from rdf_construct.uml.uml_layout import LayoutConfig, load_layout_config
+from rdf_construct.uml import uml_style
+from rdf_construct.uml.uml_style import ArrowStyle, ColorPalette, load_style_config
 
 
 def test_to_plantuml_full_spec():
@@ -57,6 +61,13 @@ def test_to_plantuml_strips_hash():
     assert result == "#back:FEFE54;line:968584;text:000000"
 
 
+def test_to_plantuml_short_hex():
+    """Test that short hex colours keep the back:/line: prefixed format."""
+    palette = ColorPalette({"fill": "#AAA", "border": "#BBB"})
+
+    assert palette.to_plantuml() == "#back:AAA;line:BBB"
+
+
 def test_to_plantuml_empty():
     """Test with no colors specified.
 
@@ -83,3 +94,143 @@ def test_to_plantuml_explicit_none():
     assert palette.fill is None
     assert palette.border is None
     assert palette.to_plantuml() == ""
+
+
+def test_arrow_syntax_with_direction():
+    """Test hierarchy arrows carry the configured direction hint."""
+    layout = LayoutConfig("test", {"arrow_direction": "down"})
+
+    assert layout.get_arrow_syntax("subclass") == "-down-|>"
+    assert layout.get_arrow_syntax("instance") == "-down-|>"
+    assert layout.get_arrow_syntax("object_property") == "->"
+    assert layout.get_arrow_syntax("unknown") == "->"
+
+
+def test_arrow_syntax_without_arrows():
+    """Test that disabling arrows gives plain lines for every type."""
+    layout = LayoutConfig("test", {"show_arrows": False})
+
+    assert layout.get_arrow_syntax("subclass") == "--"
+    assert layout.get_arrow_syntax("unknown") == "--"
+
+
+def test_layout_config_reload_picks_up_changes(tmp_path):
+    """Test that cached layout parsing is invalidated when the file changes."""
+    path = tmp_path / "layouts.yml"
+    path.write_text("layouts:\n  first: {}\n", encoding="utf-8")
+    assert load_layout_config(path).list_layouts() == ["first"]
+
+    path.write_text("layouts:\n  second: {}\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_layout_config(path).list_layouts() == ["second"]
+
+
+def test_layout_config_reload_same_mtime_new_size(tmp_path):
+    """Test that a rewrite within the mtime granularity is still picked up."""
+    path = tmp_path / "layouts.yml"
+    path.write_text("layouts:\n  first: {}\n", encoding="utf-8")
+    mtime_ns = path.stat().st_mtime_ns
+    assert load_layout_config(path).list_layouts() == ["first"]
+
+    path.write_text("layouts:\n  renamed: {}\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert load_layout_config(path).list_layouts() == ["renamed"]
+
+
+def test_layout_config_copies_cached_data(tmp_path):
+    """Test that mutating one loaded config does not leak into the next."""
+    path = tmp_path / "layouts.yml"
+    path.write_text("layouts:\n  first:\n    spacing: {nodesep: 10}\n", encoding="utf-8")
+
+    load_layout_config(path).get_layout("first").spacing["nodesep"] = 99
+
+    assert load_layout_config(path).get_layout("first").spacing == {"nodesep": 10}
+
+
+@pytest.mark.parametrize(
+    "direction, expected",
+    [
+        ("TB", "top_to_bottom"),
+        ("lr", "left_to_right"),
+        ("right_to_left", "right_to_left"),
+        ("sideways", "top_to_bottom"),
+    ],
+)
+def test_layout_direction_aliases(direction, expected):
+    """Test that direction aliases normalise case-insensitively."""
+    layout = LayoutConfig("test", {"direction": direction, "arrow_direction": "Left"})
+
+    assert layout.direction == expected
+    assert layout.arrow_direction == "left"
+
+
+def test_style_config_reload_picks_up_changes(tmp_path):
+    """Test that cached style parsing is invalidated when the file changes."""
+    path = tmp_path / "styles.yml"
+    path.write_text("schemes:\n  first: {}\n", encoding="utf-8")
+    assert load_style_config(path).list_schemes() == ["first"]
+
+    path.write_text("schemes:\n  second: {}\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_style_config(path).list_schemes() == ["second"]
+
+
+def test_style_config_copies_cached_data(tmp_path):
+    """Test that mutating one loaded style config does not leak into the next."""
+    path = tmp_path / "styles.yml"
+    path.write_text("schemes:\n  first: {description: original}\n", encoding="utf-8")
+
+    load_style_config(path).config["schemes"]["first"]["description"] = "changed"
+
+    assert load_style_config(path).get_scheme("first").description == "original"
+
+
+def test_arrow_style_directive():
+    """Test arrow skinparam directives, including the uncustomised case."""
+    assert ArrowStyle({"color": "#FF0000", "thickness": 2}).to_plantuml_directive() == (
+        "skinparam arrowColor #FF0000\nskinparam arrowThickness 2"
+    )
+    assert ArrowStyle({}).to_plantuml_directive() == "skinparam arrowColor #000000"
+    assert ArrowStyle({"color": None}).to_plantuml_directive() is None
+
+
+def test_style_config_json_sidecar(tmp_path, monkeypatch):
+    """Test the opt-in JSON sidecar cache for style files."""
+    monkeypatch.setenv(uml_style.STYLE_CACHE_ENV, "1")
+    path = tmp_path / "styles.yml"
+    path.write_text("schemes:\n  first: {description: from yaml}\n", encoding="utf-8")
+    sidecar = tmp_path / "styles.yml.cache.json"
+
+    assert load_style_config(path).get_scheme("first").description == "from yaml"
+    assert sidecar.exists()
+
+    # A sidecar newer than the YAML file is read instead of the YAML
+    sidecar.write_text('{"schemes": {"first": {"description": "from json"}}}')
+    uml_style._parse_style_yaml.cache_clear()
+    assert load_style_config(path).get_scheme("first").description == "from json"
+
+
+def test_style_config_sidecar_disabled_by_default(tmp_path, monkeypatch):
+    """Test that no sidecar is written unless the cache is enabled."""
+    monkeypatch.delenv(uml_style.STYLE_CACHE_ENV, raising=False)
+    path = tmp_path / "styles.yml"
+    path.write_text("schemes:\n  first: {}\n", encoding="utf-8")
+
+    load_style_config(path)
+
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_style_config_sidecar_toggle_after_parse(tmp_path, monkeypatch):
+    """Test that enabling the sidecar applies to a file already parsed."""
+    monkeypatch.delenv(uml_style.STYLE_CACHE_ENV, raising=False)
+    path = tmp_path / "styles.yml"
+    path.write_text("schemes:\n  first: {}\n", encoding="utf-8")
+    load_style_config(path)
+
+    monkeypatch.setenv(uml_style.STYLE_CACHE_ENV, "1")
+    load_style_config(path)
+
+    assert (tmp_path / "styles.yml.cache.json").exists()
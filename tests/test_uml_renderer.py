@@ -0,0 +1,196 @@
+"""Test suite for the default PlantUML renderer.
+
+Tests the everything-as-class rendering mode for PlantUML diagrams.
+"""
+
+import os
+
+import pytest
+from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef
+from rdflib.namespace import OWL, XSD
+
+from rdf_construct.uml.renderer import (
+    PlantUMLRenderer,
+    render_plantuml,
+    qname,
+    safe_label,
+    plantuml_identifier,
+)
+
+# Test namespaces
+EX = Namespace("http://example.org/")
+
+
+@pytest.fixture
+def simple_graph():
+    """Create a simple test graph with classes, properties and instances."""
+    g = Graph()
+    g.bind("ex", EX)
+
+    # Add classes
+    g.add((EX.Animal, RDF.type, OWL.Class))
+    g.add((EX.Dog, RDF.type, OWL.Class))
+    g.add((EX.Dog, RDFS.subClassOf, EX.Animal))
+
+    # Add object property
+    g.add((EX.hasParent, RDF.type, OWL.ObjectProperty))
+    g.add((EX.hasParent, RDFS.domain, EX.Animal))
+    g.add((EX.hasParent, RDFS.range, EX.Animal))
+
+    # Add datatype property
+    g.add((EX.age, RDF.type, OWL.DatatypeProperty))
+    g.add((EX.age, RDFS.domain, EX.Animal))
+    g.add((EX.age, RDFS.range, XSD.integer))
+    g.add((EX.age, RDFS.label, Literal("age in years")))
+
+    # Add individuals
+    g.add((EX.Fido, RDF.type, EX.Dog))
+    g.add((EX.Fido, RDFS.label, Literal("Fido")))
+    g.add((EX.Fido, EX.age, Literal(3)))
+    g.add((EX.Rex, RDF.type, EX.Dog))
+    g.add((EX.Rex, EX.hasParent, EX.Fido))
+
+    return g
+
+
+@pytest.fixture
+def entities(simple_graph):
+    """Create entity dictionary for rendering."""
+    return {
+        "classes": {EX.Animal, EX.Dog},
+        "object_properties": {EX.hasParent},
+        "datatype_properties": {EX.age},
+        "annotation_properties": set(),
+        "instances": {EX.Fido, EX.Rex},
+    }
+
+
+class TestPlantUMLRenderer:
+    """Test default renderer functionality."""
+
+    def test_render_class(self, simple_graph, entities):
+        """Test class rendering with stereotype."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        lines = renderer.render_class(EX.Animal)
+
+        assert lines == ["class ex.Animal << (C, #FFFFFF) owl:Class >>"]
+
+    def test_render_instance_uses_label(self, simple_graph, entities):
+        """Test instance rendering with an rdfs:label alias."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        lines = renderer.render_instance(EX.Fido)
+
+        assert lines == ['class "Fido" as ex.Fido << (I, #FFFFFF) ex:Dog >>']
+
+    def test_render_relationships(self, simple_graph, entities):
+        """Test that relationships render with their labels."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        output = renderer.render()
+
+        assert "ex.Dog -u-|> ex.Animal : <<rdfs:subClassOf>>" in output
+        assert "ex.Fido -u[#FF0000]-> ex.Dog : <<rdf:type>>" in output
+        assert "ex.hasParent -u-> ex.Animal : <<rdfs:domain>>" in output
+        assert "ex.hasParent -u-> ex.Animal : <<rdfs:range>>" in output
+        assert "ex.Rex -u-> ex.Fido : <<ex:hasParent>>" in output
+
+    def test_render_datatype_notes(self, simple_graph, entities):
+        """Test that datatype properties render as notes."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        output = renderer.render()
+
+        assert 'note "3" as N1' in output
+        assert "ex.Fido .u. N1 : <<ex:age>>" in output
+        assert 'note "ageInYears: integer" as N2' in output
+        assert "ex.Animal .u. N2 : <<ex:age>>" in output
+
+    def test_render_sorts_entities(self, simple_graph, entities):
+        """Test that entity declarations are sorted by QName."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        output = renderer.render()
+
+        assert output.index("class ex.Animal") < output.index("class ex.Dog")
+        assert output.index('as ex.Fido') < output.index("class ex.Rex")
+
+    def test_render_sorts_relationships(self, simple_graph, entities):
+        """Test that relationships are emitted in QName order."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        lines = renderer.render_type_relationships()
+
+        assert lines == [
+            "ex.Fido -u[#FF0000]-> ex.Dog : <<rdf:type>>",
+            "ex.Rex -u[#FF0000]-> ex.Dog : <<rdf:type>>",
+        ]
+
+    def test_iter_lines_matches_render(self, simple_graph, entities):
+        """Test that streaming lines reproduces the rendered diagram."""
+        lines = list(PlantUMLRenderer(simple_graph, entities).iter_lines())
+
+        assert "\n".join(lines) == PlantUMLRenderer(simple_graph, entities).render()
+        assert lines[0] == "@startuml"
+        assert lines[-1] == "@enduml"
+
+    def test_cached_helpers_match_functions(self, simple_graph, entities):
+        """Test that cached lookups agree with the module-level helpers."""
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        for uri in (EX.Animal, EX.age, EX.Fido, OWL.Class):
+            assert renderer._qn(uri) == qname(simple_graph, uri)
+            assert renderer._id(uri) == plantuml_identifier(simple_graph, uri)
+            assert renderer._label(uri, camelcase=True) == safe_label(
+                simple_graph, uri, camelcase=True
+            )
+
+    def test_prefix_table_matches_namespace_manager(self, simple_graph, entities):
+        """Test that prefix table lookups agree with normalizeUri edge cases."""
+        simple_graph.bind("sub", "http://example.org/sub_")
+        renderer = PlantUMLRenderer(simple_graph, entities)
+
+        for uri in (
+            "http://example.org/Dog",
+            "http://example.org/nested/Dog",
+            "http://example.org/sub_Dog",
+            "http://unbound.org/Dog",
+            "urn:example",
+        ):
+            assert renderer._lookup_qname(URIRef(uri)) == qname(simple_graph, URIRef(uri))
+
+
+class TestRenderPlantuml:
+    """Test the main render function."""
+
+    def test_render_to_string(self, simple_graph, entities):
+        """Test rendering to string without file output."""
+        output = render_plantuml(simple_graph, entities)
+
+        assert output.startswith("@startuml")
+        assert output.endswith("@enduml")
+
+    def test_render_to_file(self, simple_graph, entities, tmp_path):
+        """Test rendering to file leaves no temporary file behind."""
+        output_path = tmp_path / "diagram.puml"
+
+        output = render_plantuml(simple_graph, entities, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == output
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_failed_write_removes_temp_file(
+        self, simple_graph, entities, tmp_path, monkeypatch
+    ):
+        """Test that a failed swap leaves neither output nor temp file."""
+        output_path = tmp_path / "diagram.puml"
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            render_plantuml(simple_graph, entities, output_path)
+
+        assert list(tmp_path.iterdir()) == []